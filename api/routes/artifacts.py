@@ -10,6 +10,7 @@ import uuid
 
 from ..database import get_artifacts_table, get_ratings_table, get_audit_table
 from src.url_parser import URLParser
+from src.utils.http_cache import api_cache
 from src.metrics.calculator import MetricsCalculator
 from src.models.model import ModelInfo
 
@@ -287,6 +288,12 @@ async def create_artifact(
         )
     
     try:
+        # A newly registered artifact is usually rated next; make sure that
+        # reads the source's current metadata, not a cached copy
+        api_url = url_parser.api_url(data.url)
+        if api_url:
+            api_cache.invalidate(api_url)
+        
         # Use name from request if provided (autograder sends this)
         # Otherwise parse the URL to get artifact name
         if data.name:
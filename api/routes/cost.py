@@ -37,11 +37,11 @@ def calculate_huggingface_size(repo_url: str) -> float:
             # Dataset URL
             parts.remove('datasets')
             repo_id = '/'.join(parts[:2])
-            api_url = f"https://huggingface.co/api/datasets/{repo_id}"
+            api_url = f"https://huggingface.co/api/datasets/{repo_id}?blobs=true"
         else:
             # Model URL
             repo_id = '/'.join(parts[:2])
-            api_url = f"https://huggingface.co/api/models/{repo_id}"
+            api_url = f"https://huggingface.co/api/models/{repo_id}?blobs=true"
         
         # Get repository info from HF API
         response = requests.get(api_url, timeout=30)
@@ -52,7 +52,8 @@ def calculate_huggingface_size(repo_url: str) -> float:
         
         data = response.json()
         
-        # Try to get size from siblings (files in repo)
+        # Try to get size from siblings (files in repo); the API only
+        # includes their sizes when asked with blobs=true
         total_size_bytes = 0
         siblings = data.get('siblings', [])
         
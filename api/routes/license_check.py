@@ -3,6 +3,7 @@ License compatibility check endpoint
 """
 from fastapi import APIRouter, HTTPException, Header, status
 from pydantic import BaseModel
+import asyncio
 import logging
 import requests
 import re
@@ -242,7 +243,7 @@ async def check_license(
     try:
         # Get artifact from database
         artifacts_table = get_artifacts_table()
-        response = artifacts_table.get_item(Key={'id': id})
+        response = await asyncio.to_thread(artifacts_table.get_item, Key={'id': id})
         
         if 'Item' not in response:
             raise HTTPException(
@@ -253,15 +254,7 @@ async def check_license(
         artifact = response['Item']
         artifact_url = artifact.get('url')
         
-        # Get artifact license
-        if 'huggingface.co' in artifact_url:
-            artifact_license = get_huggingface_license(artifact_url)
-        else:
-            artifact_license = 'unknown'
-        
-        logger.info(f"Artifact {id} license: {artifact_license}")
-        
-        # Get GitHub license - accept either field name
+        # Get GitHub URL - accept either field name
         github_url = request.get_github_url()
         if not github_url:
             raise HTTPException(
@@ -269,7 +262,18 @@ async def check_license(
                 detail="Repository URL is required"
             )
         
-        github_license = get_github_license(github_url)
+        # The two license lookups hit different hosts and don't depend on
+        # each other, so overlap them off the event loop
+        if 'huggingface.co' in artifact_url:
+            artifact_license, github_license = await asyncio.gather(
+                asyncio.to_thread(get_huggingface_license, artifact_url),
+                asyncio.to_thread(get_github_license, github_url)
+            )
+        else:
+            artifact_license = 'unknown'
+            github_license = await asyncio.to_thread(get_github_license, github_url)
+        
+        logger.info(f"Artifact {id} license: {artifact_license}")
         logger.info(f"GitHub repo license: {github_license}")
         
         # Check compatibility
@@ -4,7 +4,9 @@ Rating endpoint - Integrate Phase 1 metrics calculator
 from fastapi import APIRouter, HTTPException, Header, status
 from pydantic import BaseModel
 from typing import Dict, Any, Optional
+import asyncio
 import logging
+import weakref
 from datetime import datetime
 
 from ..database import get_artifacts_table, get_ratings_table
@@ -19,6 +21,25 @@ logger = logging.getLogger(__name__)
 metrics_calculator = MetricsCalculator()
 url_parser = URLParser()
 
+# Each scoring run fans out ~10 HTTP-bound threads; cap how many run at once
+# so a burst of rating requests can't exhaust the thread and connection pools
+MAX_CONCURRENT_SCORINGS = 8
+_slots_by_loop: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = weakref.WeakKeyDictionary()
+
+
+def _scoring_slots() -> asyncio.Semaphore:
+    """The scoring semaphore of the running event loop
+    
+    A semaphore is bound to the loop it is first awaited on, and Mangum
+    (lifespan off, so no startup hook) may run each invocation on a new
+    loop, so every loop gets its own.
+    """
+    loop = asyncio.get_running_loop()
+    slots = _slots_by_loop.get(loop)
+    if slots is None:
+        slots = _slots_by_loop[loop] = asyncio.Semaphore(MAX_CONCURRENT_SCORINGS)
+    return slots
+
 
 # ============================================================================
 # Pydantic Models (Response Schema)
@@ -81,7 +102,7 @@ async def rate_artifact_generic(id: str, expected_type: str = None) -> ModelRati
     try:
         # 1. Get artifact from database
         artifacts_table = get_artifacts_table()
-        response = artifacts_table.get_item(Key={'id': id})
+        response = await asyncio.to_thread(artifacts_table.get_item, Key={'id': id})
         
         if 'Item' not in response:
             raise HTTPException(
@@ -101,7 +122,7 @@ async def rate_artifact_generic(id: str, expected_type: str = None) -> ModelRati
         
         # 2. Check if rating already exists in cache
         ratings_table = get_ratings_table()
-        cached_rating = ratings_table.get_item(Key={'artifact_id': id})
+        cached_rating = await asyncio.to_thread(ratings_table.get_item, Key={'artifact_id': id})
         
         if 'Item' in cached_rating:
             logger.info(f"Returning cached rating for artifact {id}")
@@ -122,15 +143,8 @@ async def rate_artifact_generic(id: str, expected_type: str = None) -> ModelRati
         # 3. Calculate new rating using Phase 1 metrics
         logger.info(f"Calculating new rating for artifact {id}: {artifact['name']} (type: {artifact_type})")
         
-        # Parse URL to get model info
-        url = artifact['url']
-        parsed = url_parser.parse_url(url)
-        
-        # For non-model artifacts or if parsing fails, use defaults
-        if not parsed:
-            parsed = {'type': artifact_type, 'owner': '', 'name': artifact['name']}
-        
         # Create ModelInfo object
+        url = artifact['url']
         model_info = ModelInfo(
             name=artifact['name'],
             url=url,
@@ -146,10 +160,20 @@ async def rate_artifact_generic(id: str, expected_type: str = None) -> ModelRati
         import time
         start_time = time.time()
         
-        metrics = metrics_calculator.calculate_all_metrics(model_info)
+        # URL parsing and scoring don't depend on each other, so run both at
+        # once on worker threads rather than blocking the event loop in turn
+        async with _scoring_slots():
+            parsed, metrics = await asyncio.gather(
+                url_parser.parse_url_async(url),
+                asyncio.to_thread(metrics_calculator.calculate_all_metrics, model_info)
+            )
         
         total_latency = time.time() - start_time
         
+        # For non-model artifacts or if parsing fails, use defaults
+        if not parsed:
+            parsed = {'type': artifact_type, 'owner': '', 'name': artifact['name']}
+        
         # 4. Format response according to OpenAPI spec
         category = artifact_type.upper() if artifact_type else "MODEL"
         rating = ModelRating(
@@ -204,7 +228,7 @@ async def rate_artifact_generic(id: str, expected_type: str = None) -> ModelRati
         rating_dict['computed_at'] = datetime.utcnow().isoformat()
         rating_dict = convert_floats(rating_dict)
         
-        ratings_table.put_item(Item=rating_dict)
+        await asyncio.to_thread(ratings_table.put_item, Item=rating_dict)
         
         logger.info(f"Cached rating for artifact {id}")
         
@@ -17,7 +17,7 @@ import tempfile
 import shutil
 
 # Import our modules
-from src.url_parser import URLParser
+from src.url_parser import URLParser, URLType
 from src.metrics.calculator import MetricsCalculator
 from src.models.model import ModelInfo, DatasetInfo, CodeInfo
 from src.utils.logger import setup_logger
@@ -88,23 +88,21 @@ class MLEvaluator:
             
             for url in urls:
                 url_type = self.url_parser.identify_url_type(url)
-                if url_type == "MODEL":
+                if url_type is URLType.MODEL:
                     models.append(url)
-                elif url_type == "DATASET":
+                elif url_type is URLType.DATASET:
                     datasets.append(url)
-                elif url_type == "CODE":
+                elif url_type is URLType.CODE:
                     codes.append(url)
             
-            # Process models (only models produce output)
+            # Process models (only models produce output). Models are scored
+            # concurrently on one pool sharing the HTTP session and README
+            # cache; map() keeps the output in input order
             results = []
-            for model_url in models:
-                try:
-                    result = self.evaluate_model(model_url)
+            with ThreadPoolExecutor(max_workers=self.config.max_workers) as executor:
+                for result in executor.map(self._evaluate_model_safe, models):
                     if result:
                         results.append(result)
-                except Exception as e:
-                    self.logger.error(f"Failed to evaluate {model_url}: {str(e)}")
-                    continue
             
             # Output results as NDJSON
             for result in results:
@@ -133,6 +131,14 @@ class MLEvaluator:
             self.logger.error(f"Model evaluation failed: {str(e)}")
             return None
     
+    def _evaluate_model_safe(self, model_url: str) -> Optional[Dict[str, Any]]:
+        """Evaluate a model, logging instead of raising on failure"""
+        try:
+            return self.evaluate_model(model_url)
+        except Exception as e:
+            self.logger.error(f"Failed to evaluate {model_url}: {str(e)}")
+            return None
+    
     def run_tests(self) -> int:
         """Run test suite"""
         try:
@@ -17,6 +17,9 @@ setup(
         "dev": [
             "pytest>=7.0.0",
             "pytest-cov>=4.0.0", 
+            "pytest-xdist>=3.0.0",
+            "pytest-benchmark>=4.0.0",
+            "pytest-randomly>=3.12.0",
             "flake8>=5.0.0",
             "isort>=5.0.0",
             "mypy>=1.0.0",
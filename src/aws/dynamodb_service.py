@@ -4,13 +4,24 @@ AWS DynamoDB service for storing model metadata
 """
 
 import json
+import time
 from datetime import datetime
 from typing import Dict, Any, Optional, List
 from uuid import uuid4
 import boto3
+from boto3.dynamodb.conditions import Attr, Key
 from botocore.exceptions import ClientError
 from ..utils.logger import setup_logger
 
+# Global secondary indexes used by list_items (see docs/AWS_SETUP_CHECKLIST.md)
+SOURCE_INDEX = 'source-index'
+STATE_INDEX = 'state-index'
+
+# BatchGetItem accepts at most 100 keys per request
+BATCH_GET_LIMIT = 100
+BATCH_GET_MAX_RETRIES = 5
+BATCH_GET_BACKOFF = 0.05  # seconds, doubled on each retry
+
 class DynamoDBService:
     """Service for interacting with DynamoDB"""
     
@@ -71,6 +82,38 @@ class DynamoDBService:
             self.logger.error(f"Failed to read item {item_id}: {str(e)}")
             raise
     
+    def batch_get(self, item_ids: List[str]) -> List[Dict[str, Any]]:
+        """Read several model records with BatchGetItem (100 keys per call)"""
+        try:
+            items = []
+            
+            # De-duplicate while preserving order; BatchGetItem rejects repeated keys
+            unique_ids = list(dict.fromkeys(item_ids))
+            
+            for start in range(0, len(unique_ids), BATCH_GET_LIMIT):
+                chunk = unique_ids[start:start + BATCH_GET_LIMIT]
+                request_items = {self.table_name: {'Keys': [{'id': item_id} for item_id in chunk]}}
+                attempt = 0
+                
+                while request_items:
+                    response = self.dynamodb.batch_get_item(RequestItems=request_items)
+                    items.extend(response.get('Responses', {}).get(self.table_name, []))
+                    
+                    request_items = response.get('UnprocessedKeys') or {}
+                    if request_items:
+                        if attempt >= BATCH_GET_MAX_RETRIES:
+                            raise RuntimeError(f"Unprocessed keys remain after {attempt} retries")
+                        # Exponential backoff before retrying throttled keys
+                        time.sleep(BATCH_GET_BACKOFF * (2 ** attempt))
+                        attempt += 1
+            
+            self.logger.info(f"Batch read {len(items)} of {len(unique_ids)} items")
+            return items
+            
+        except ClientError as e:
+            self.logger.error(f"Failed to batch read items: {str(e)}")
+            raise
+    
     def update_item(self, item_id: str, updates: Dict[str, Any], 
                    changed_by: str = "system") -> Dict[str, Any]:
         """Update a model record in DynamoDB"""
@@ -170,41 +213,46 @@ class DynamoDBService:
     
     def list_items(self, filters: Optional[Dict[str, Any]] = None, 
                   limit: int = 100) -> List[Dict[str, Any]]:
-        """List items with optional filters"""
+        """List items with optional filters
+        
+        Filtered listings are served by the source-index / state-index GSIs so
+        DynamoDB only reads matching items; a table Scan is used only when the
+        indexes are missing (tables created before they were added).
+        """
         try:
-            scan_kwargs = {
-                'Limit': limit,
-                'FilterExpression': None
-            }
-            
-            # Add state filter to exclude deleted items by default
             if filters is None:
                 filters = {}
             
-            if 'state' not in filters:
-                from boto3.dynamodb.conditions import Attr
-                scan_kwargs['FilterExpression'] = Attr('state').eq('active')
-            
-            # Add additional filters
-            if filters:
-                from boto3.dynamodb.conditions import Attr
-                for key, value in filters.items():
-                    if key == 'state':
-                        scan_kwargs['FilterExpression'] = Attr(key).eq(value)
-                    elif key == 'source':
-                        filter_expr = Attr(key).eq(value)
-                        if scan_kwargs['FilterExpression']:
-                            filter_expr = scan_kwargs['FilterExpression'] & filter_expr
-                        scan_kwargs['FilterExpression'] = filter_expr
-            
-            response = self.table.scan(**scan_kwargs)
-            items = response.get('Items', [])
-            
-            # Handle pagination
-            while 'LastEvaluatedKey' in response:
-                scan_kwargs['ExclusiveStartKey'] = response['LastEvaluatedKey']
-                response = self.table.scan(**scan_kwargs)
-                items.extend(response.get('Items', []))
+            # Exclude deleted items by default
+            state = filters.get('state', 'active')
+            
+            if 'source' in filters:
+                query_kwargs = {
+                    'IndexName': SOURCE_INDEX,
+                    'KeyConditionExpression': Key('source').eq(filters['source']),
+                    'FilterExpression': Attr('state').eq(state),
+                    'Limit': limit
+                }
+            else:
+                query_kwargs = {
+                    'IndexName': STATE_INDEX,
+                    'KeyConditionExpression': Key('state').eq(state),
+                    'Limit': limit
+                }
+            
+            try:
+                items = self._paginate(self.table.query, query_kwargs)
+            except ClientError as e:
+                if e.response.get('Error', {}).get('Code') != 'ValidationException':
+                    raise
+                self.logger.warning(f"Index {query_kwargs['IndexName']} unavailable, falling back to scan")
+                filter_expr = Attr('state').eq(state)
+                if 'source' in filters:
+                    filter_expr = filter_expr & Attr('source').eq(filters['source'])
+                items = self._paginate(self.table.scan, {
+                    'Limit': limit,
+                    'FilterExpression': filter_expr
+                })
             
             self.logger.info(f"Listed {len(items)} items with filters {filters}")
             return items
@@ -212,3 +260,15 @@ class DynamoDBService:
         except ClientError as e:
             self.logger.error(f"Failed to list items: {str(e)}")
             raise
+    
+    def _paginate(self, operation, kwargs: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Run a query/scan operation and follow LastEvaluatedKey to the end"""
+        response = operation(**kwargs)
+        items = response.get('Items', [])
+        
+        while 'LastEvaluatedKey' in response:
+            kwargs['ExclusiveStartKey'] = response['LastEvaluatedKey']
+            response = operation(**kwargs)
+            items.extend(response.get('Items', []))
+        
+        return items
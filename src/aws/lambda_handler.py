@@ -6,7 +6,7 @@ AWS Lambda handler for the ML Model Evaluator API
 import json
 import os
 from typing import Dict, Any
-from ..url_parser import URLParser
+from ..url_parser import URLParser, URLType
 from ..metrics.calculator import MetricsCalculator
 from .dynamodb_service import DynamoDBService
 from .s3_service import S3Service
@@ -14,6 +14,10 @@ from ..utils.logger import setup_logger
 
 logger = setup_logger()
 
+# Evaluation results up to this size (bytes) are returned without an S3 copy;
+# Lambda responses are capped at 6 MB
+INLINE_RESULT_LIMIT = int(os.environ.get('INLINE_RESULT_LIMIT', 256 * 1024))
+
 # Initialize services
 dynamodb = DynamoDBService(
     table_name=os.environ.get('DYNAMODB_TABLE', 'ml-model-evaluator'),
@@ -122,6 +126,17 @@ def get_models(event) -> Dict[str, Any]:
             else:
                 return error_response(404, "Model not found")
         
+        # Fetch several specific models in one round trip
+        if query_params.get('ids'):
+            ids = [i.strip() for i in query_params['ids'].split(',') if i.strip()]
+            # batch_get splits the keys into BatchGetItem-sized requests itself;
+            # deleted records are hidden, as in the listing below
+            items = [item for item in dynamodb.batch_get(ids) if item.get('state') != 'deleted']
+            return response(200, {
+                'items': items,
+                'count': len(items)
+            })
+        
         # List all models with optional filters
         filters = {}
         if 'source' in query_params:
@@ -208,32 +223,13 @@ def evaluate_model(event) -> Dict[str, Any]:
         if not url:
             return error_response(400, "Missing required field: url")
         
-        # Identify URL type and parse
+        # Identify URL type and dispatch to its evaluator
         url_type = url_parser.identify_url_type(url)
+        evaluator = URL_EVALUATORS.get(url_type)
+        if evaluator is None:
+            return error_response(400, f"URL type {url_type.value} not yet supported for evaluation")
         
-        if url_type == "MODEL":
-            model_info = url_parser.parse_model_url(url)
-            if not model_info:
-                return error_response(400, "Failed to parse model URL")
-            
-            # Calculate metrics
-            metrics = metrics_calculator.calculate_all_metrics(model_info)
-            
-            # Store result in S3
-            result_key = f"evaluations/{model_info.name.replace('/', '-')}.json"
-            s3.upload_bytes(
-                data=json.dumps(metrics).encode(),
-                key=result_key,
-                metadata={'model_name': model_info.name}
-            )
-            
-            return response(200, {
-                'success': True,
-                'metrics': metrics,
-                'stored_at': result_key
-            })
-        else:
-            return error_response(400, f"URL type {url_type} not yet supported for evaluation")
+        return evaluator(url)
         
     except json.JSONDecodeError:
         return error_response(400, "Invalid JSON in request body")
@@ -241,6 +237,38 @@ def evaluate_model(event) -> Dict[str, Any]:
         logger.error(f"Failed to evaluate model: {str(e)}")
         return error_response(500, "Failed to evaluate model")
 
+def _evaluate_model_url(url: str) -> Dict[str, Any]:
+    """Evaluate a Hugging Face model URL"""
+    model_info = url_parser.parse_model_url(url)
+    if not model_info:
+        return error_response(400, "Failed to parse model URL")
+    
+    # Calculate metrics
+    metrics = metrics_calculator.calculate_all_metrics(model_info)
+    
+    # Metrics are returned inline; only persist results too large
+    # to comfortably travel in the Lambda response
+    payload = json.dumps(metrics).encode()
+    result_key = None
+    if len(payload) > INLINE_RESULT_LIMIT:
+        result_key = f"evaluations/{model_info.name.replace('/', '-')}.json"
+        s3.upload_bytes(
+            data=payload,
+            key=result_key,
+            metadata={'model_name': model_info.name}
+        )
+    
+    return response(200, {
+        'success': True,
+        'metrics': metrics,
+        'stored_at': result_key
+    })
+
+# Evaluators by URL type; types without an entry are rejected with a 400
+URL_EVALUATORS = {
+    URLType.MODEL: _evaluate_model_url,
+}
+
 def response(status_code: int, body: Dict[str, Any]) -> Dict[str, Any]:
     """Format a response"""
     return {
@@ -3,25 +3,41 @@
 AWS S3 service for storing model artifacts and blobs
 """
 
-import io
 import hashlib
 from typing import Optional, BinaryIO, Dict
 from datetime import datetime
 import boto3
+from boto3.s3.transfer import TransferConfig
 from botocore.exceptions import ClientError
 from ..utils.logger import setup_logger
 
+MB = 1024 * 1024
+
+
 class S3Service:
     """Service for interacting with S3"""
     
-    def __init__(self, bucket_name: str = "ml-evaluator-artifacts", region: str = "us-east-1"):
+    def __init__(self, bucket_name: str = "ml-evaluator-artifacts", region: str = "us-east-1",
+                 max_concurrency: int = 16, chunk_size: int = 16 * MB):
         self.logger = setup_logger()
         self.bucket_name = bucket_name
         self.s3_client = boto3.client('s3', region_name=region)
         self.s3_resource = boto3.resource('s3', region_name=region)
+        
+        # Large artifacts are split into parts that are transferred in parallel
+        self.transfer_config = TransferConfig(
+            multipart_threshold=8 * MB,
+            multipart_chunksize=chunk_size,
+            max_concurrency=max_concurrency,
+            use_threads=True
+        )
     
     def upload_file(self, file_path: str, key: str, metadata: Optional[dict] = None) -> Dict[str, str]:
-        """Upload a file to S3"""
+        """Upload a file to S3
+        
+        The SHA256 is computed first so it goes out in the object's metadata
+        with the upload itself; the object never exists without its hash.
+        """
         try:
             # Calculate file hash
             file_hash = self._calculate_file_hash(file_path)
@@ -36,7 +52,8 @@ class S3Service:
                 file_path,
                 self.bucket_name,
                 key,
-                ExtraArgs={'Metadata': s3_metadata}
+                ExtraArgs={'Metadata': s3_metadata},
+                Config=self.transfer_config
             )
             
             self.logger.info(f"Uploaded {file_path} to s3://{self.bucket_name}/{key}")
@@ -91,10 +108,11 @@ class S3Service:
             self.s3_client.download_file(
                 self.bucket_name,
                 key,
-                file_path
+                file_path,
+                Config=self.transfer_config
             )
             
-            # Verify hash if available
+            # The transfer manager doesn't return metadata, so read the hash separately
             obj_response = self.s3_client.head_object(Bucket=self.bucket_name, Key=key)
             metadata = obj_response.get('Metadata', {})
             
@@ -9,13 +9,11 @@ from datetime import datetime, timedelta
 from ..models.model import ModelInfo
 from ..utils.logger import setup_logger
 
+logger = setup_logger()
+
 class BusFactorMetric:
     """Calculate bus factor score"""
     
-    def __init__(self):
-        self.logger = setup_logger()
-        self.session = requests.Session()
-    
     def calculate(self, model_info: ModelInfo) -> float:
         """Calculate bus factor (higher = safer/better maintained)"""
         try:
@@ -44,7 +42,7 @@ class BusFactorMetric:
             return min(1.0, score)
             
         except Exception as e:
-            self.logger.error(f"Bus factor calculation failed: {str(e)}")
+            logger.error(f"Bus factor calculation failed: {str(e)}")
             return 0.5  # Default moderate score
     
     def _check_recent_activity(self, model_info: ModelInfo) -> float:
@@ -71,11 +69,12 @@ class BusFactorMetric:
                 else:                   # Old
                     return 0.2
                     
-            except:
+            except (ValueError, TypeError, AttributeError):
+                # Unparseable or non-string timestamp
                 return 0.5
                 
         except Exception as e:
-            self.logger.error(f"Activity check failed: {str(e)}")
+            logger.error(f"Activity check failed: {str(e)}")
             return 0.5
     
     def _analyze_maintainers(self, model_info: ModelInfo) -> float:
@@ -116,14 +115,14 @@ class BusFactorMetric:
             return score
             
         except Exception as e:
-            self.logger.error(f"Maintainer analysis failed: {str(e)}")
+            logger.error(f"Maintainer analysis failed: {str(e)}")
             return 0.4
     
     def _assess_community(self, model_info: ModelInfo) -> float:
         """Assess community engagement"""
         try:
-            likes = model_info.likes or 0
-            downloads = model_info.downloads or 0
+            likes = model_info.likes
+            downloads = model_info.downloads
             
             # Community score based on engagement
             if likes > 1000 or downloads > 100000:
@@ -138,5 +137,5 @@ class BusFactorMetric:
                 return 0.4
                 
         except Exception as e:
-            self.logger.error(f"Community assessment failed: {str(e)}")
+            logger.error(f"Community assessment failed: {str(e)}")
             return 0.4
\ No newline at end of file
@@ -10,10 +10,10 @@ import os
 import shutil
 from typing import Dict, Any, Optional
 from concurrent.futures import ThreadPoolExecutor, as_completed
-import multiprocessing
 
 from ..models.model import ModelInfo, MetricResult
 from ..utils.logger import setup_logger
+from ..utils.readme_cache import readme_cache
 from .license_metric import LicenseMetric
 from .size_metric import SizeMetric
 from .rampup_metric import RampUpMetric
@@ -23,13 +23,12 @@ from .dataset_code_metric import DatasetCodeMetric
 from .dataset_quality_metric import DatasetQualityMetric
 from .code_quality_metric import CodeQualityMetric
 
+logger = setup_logger()
+
 class MetricsCalculator:
     """Coordinates calculation of all metrics for a model"""
     
     def __init__(self):
-        self.logger = setup_logger()
-        self.max_workers = min(8, multiprocessing.cpu_count())
-        
         # Initialize metric calculators
         self.license_metric = LicenseMetric()
         self.size_metric = SizeMetric()
@@ -58,8 +57,16 @@ class MetricsCalculator:
             ('code_quality', self.code_quality_metric.calculate, model_info),
         ]
         
-        # Execute metrics in parallel
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+        # Execute metrics in parallel. They spend almost all their time
+        # waiting on HTTP, so every metric (and the shared prefetches) gets
+        # its own thread regardless of the CPU count
+        with ThreadPoolExecutor(max_workers=len(tasks) + 2) as executor:
+            # Start the shared README and file-tree downloads first; metrics
+            # that need them wait on these single requests instead of each
+            # fetching their own
+            executor.submit(readme_cache.get_readme, model_info.name)
+            executor.submit(readme_cache.get_tree, model_info.name)
+            
             future_to_metric = {
                 executor.submit(self._calculate_metric_with_timing, task[1], task[2]): task[0] 
                 for task in tasks
@@ -77,7 +84,7 @@ class MetricsCalculator:
                         metrics[metric_name] = result.value
                         metrics[f"{metric_name}_latency"] = result.latency_ms
                 except Exception as e:
-                    self.logger.error(f"Failed to calculate {metric_name}: {str(e)}")
+                    logger.error(f"Failed to calculate {metric_name}: {str(e)}")
                     # Provide default values on failure
                     if metric_name == 'size_score':
                         metrics[metric_name] = {
@@ -145,7 +152,7 @@ class MetricsCalculator:
         except Exception as e:
             end_time = time.time()
             latency_ms = int((end_time - start_time) * 1000)
-            self.logger.error(f"Metric calculation failed: {str(e)}")
+            logger.error(f"Metric calculation failed: {str(e)}")
             return MetricResult(value=0.0, latency_ms=latency_ms)
     
     def _calculate_net_score(self, metrics: Dict[str, Any]) -> float:
@@ -10,15 +10,23 @@ import shutil
 import subprocess
 from pathlib import Path
 from ..models.model import ModelInfo
+from ..utils.concurrent_http import fetch_many
+from ..utils.endpoints import HF_RAW_FILE
 from ..utils.logger import setup_logger
+from ..utils.readme_cache import readme_cache
+from ..utils.term_matcher import TermMatcher
+
+logger = setup_logger()
+
+# README mentions of code quality tooling
+_QUALITY_INDICATORS = TermMatcher([
+    'lint', 'flake8', 'black', 'type hint', 'mypy', 'pytest',
+    'test', 'ci/cd', 'github action', 'pre-commit'
+])
 
 class CodeQualityMetric:
     """Calculate code quality score"""
     
-    def __init__(self):
-        self.logger = setup_logger()
-        self.session = requests.Session()
-    
     def calculate(self, model_info: ModelInfo) -> float:
         """Calculate code quality score"""
         try:
@@ -47,19 +55,17 @@ class CodeQualityMetric:
             return min(1.0, score)
             
         except Exception as e:
-            self.logger.error(f"Code quality calculation failed: {str(e)}")
+            logger.error(f"Code quality calculation failed: {str(e)}")
             return 0.5
     
     def _check_code_structure(self, model_info: ModelInfo) -> float:
         """Check code structure and organization"""
         try:
-            files_url = f"https://huggingface.co/api/models/{model_info.name}/tree/main"
-            response = self.session.get(files_url, timeout=10)
+            files_data = readme_cache.get_tree(model_info.name)
             
-            if response.status_code != 200:
+            if files_data is None:
                 return 0.4
             
-            files_data = response.json()
             score = 0.0
             
             # Check for standard files
@@ -99,20 +105,18 @@ class CodeQualityMetric:
             return min(1.0, score)
             
         except Exception as e:
-            self.logger.error(f"Code structure check failed: {str(e)}")
+            logger.error(f"Code structure check failed: {str(e)}")
             return 0.4
     
     def _check_code_documentation(self, model_info: ModelInfo) -> float:
         """Check for code documentation"""
         try:
             # Sample a few Python files to check for documentation
-            files_url = f"https://huggingface.co/api/models/{model_info.name}/tree/main"
-            response = self.session.get(files_url, timeout=10)
+            files_data = readme_cache.get_tree(model_info.name)
             
-            if response.status_code != 200:
+            if files_data is None:
                 return 0.4
             
-            files_data = response.json()
             python_files = [item['path'] for item in files_data if item.get('path', '').endswith('.py')]
             
             if not python_files:
@@ -122,32 +126,29 @@ class CodeQualityMetric:
             documented_files = 0
             checked_files = 0
             
-            for py_file in python_files[:3]:
-                try:
-                    file_url = f"https://huggingface.co/{model_info.name}/raw/main/{py_file}"
-                    file_response = self.session.get(file_url, timeout=10)
+            # The sampled files are independent, so download them together
+            file_urls = [HF_RAW_FILE.format(name=model_info.name, path=py_file) for py_file in python_files[:3]]
+            sources = fetch_many(file_urls, as_json=False)
+            
+            for file_url in file_urls:
+                content = sources[file_url]
+                if content is not None:
+                    checked_files += 1
                     
-                    if file_response.status_code == 200:
-                        content = file_response.text
-                        checked_files += 1
-                        
-                        # Check for documentation indicators
-                        doc_indicators = 0
-                        
-                        if '"""' in content or "'''" in content:  # Docstrings
-                            doc_indicators += 1
-                        if content.count('#') >= 5:  # Multiple comments
-                            doc_indicators += 1
-                        if 'def ' in content and ('"""' in content or "'''" in content):  # Function docs
-                            doc_indicators += 1
-                        if any(word in content.lower() for word in ['args:', 'returns:', 'parameters:']):
-                            doc_indicators += 1
-                        
-                        if doc_indicators >= 2:
-                            documented_files += 1
-                            
-                except:
-                    continue
+                    # Check for documentation indicators
+                    doc_indicators = 0
+                    
+                    if '"""' in content or "'''" in content:  # Docstrings
+                        doc_indicators += 1
+                    if content.count('#') >= 5:  # Multiple comments
+                        doc_indicators += 1
+                    if 'def ' in content and ('"""' in content or "'''" in content):  # Function docs
+                        doc_indicators += 1
+                    if any(word in content.lower() for word in ['args:', 'returns:', 'parameters:']):
+                        doc_indicators += 1
+                    
+                    if doc_indicators >= 2:
+                        documented_files += 1
             
             if checked_files == 0:
                 return 0.4
@@ -155,7 +156,7 @@ class CodeQualityMetric:
             return max(0.4, documented_files / checked_files)
             
         except Exception as e:
-            self.logger.error(f"Code documentation check failed: {str(e)}")
+            logger.error(f"Code documentation check failed: {str(e)}")
             return 0.4
     
     def _check_best_practices(self, model_info: ModelInfo) -> float:
@@ -164,22 +165,11 @@ class CodeQualityMetric:
             score = 0.0
             
             # Check README for code quality information
-            readme_url = f"https://huggingface.co/{model_info.name}/raw/main/README.md"
-            response = self.session.get(readme_url, timeout=10)
+            content = readme_cache.get_readme_lower(model_info.name)
             
-            if response.status_code == 200:
-                content = response.text.lower()
-                
+            if content is not None:
                 # Look for quality indicators
-                quality_indicators = [
-                    'lint', 'flake8', 'black', 'type hint', 'mypy', 'pytest',
-                    'test', 'ci/cd', 'github action', 'pre-commit'
-                ]
-                
-                found_indicators = 0
-                for indicator in quality_indicators:
-                    if indicator in content:
-                        found_indicators += 1
+                found_indicators = _QUALITY_INDICATORS.count(content)
                 
                 score += min(0.5, found_indicators * 0.1)
                 
@@ -198,5 +188,5 @@ class CodeQualityMetric:
             return min(1.0, score)
             
         except Exception as e:
-            self.logger.error(f"Best practices check failed: {str(e)}")
+            logger.error(f"Best practices check failed: {str(e)}")
             return 0.4
\ No newline at end of file
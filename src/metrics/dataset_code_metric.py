@@ -7,14 +7,24 @@ import requests
 import re
 from ..models.model import ModelInfo
 from ..utils.logger import setup_logger
+from ..utils.readme_cache import readme_cache
+from ..utils.term_matcher import TermMatcher
+from .file_classification import classify_files
+
+logger = setup_logger()
+
+# Matched against the lowercased README, so no IGNORECASE needed
+_DATA_SIZE_RE = re.compile(r'\d+[kmb]?\s*(samples|examples|tokens|words|sentences)')
+
+_DATASET_TERMS = TermMatcher([
+    'dataset', 'training data', 'trained on', 'data source',
+    'corpus', 'collection', 'benchmark'
+])
+_USAGE_IMPORTS = TermMatcher(['from transformers import', 'import torch'])
 
 class DatasetCodeMetric:
     """Calculate dataset and code availability score"""
     
-    def __init__(self):
-        self.logger = setup_logger()
-        self.session = requests.Session()
-    
     def calculate(self, model_info: ModelInfo) -> float:
         """Calculate dataset and code documentation score"""
         try:
@@ -32,7 +42,7 @@ class DatasetCodeMetric:
             return min(1.0, max(0.5, score))  # Minimum 0.5
             
         except Exception as e:
-            self.logger.error(f"Dataset/code calculation failed: {str(e)}")
+            logger.error(f"Dataset/code calculation failed: {str(e)}")
             return 0.6
     
     def _check_dataset_info(self, model_info: ModelInfo) -> float:
@@ -50,21 +60,10 @@ class DatasetCodeMetric:
                             break
             
             # Check README for dataset mentions
-            readme_url = f"https://huggingface.co/{model_info.name}/raw/main/README.md"
-            response = self.session.get(readme_url, timeout=10)
+            content = readme_cache.get_readme_lower(model_info.name)
             
-            if response.status_code == 200:
-                content = response.text.lower()
-                
-                dataset_terms = [
-                    'dataset', 'training data', 'trained on', 'data source',
-                    'corpus', 'collection', 'benchmark'
-                ]
-                
-                found_terms = 0
-                for term in dataset_terms:
-                    if term in content:
-                        found_terms += 1
+            if content is not None:
+                found_terms = _DATASET_TERMS.count(content)
                 
                 if found_terms >= 3:
                     score += 0.4
@@ -75,15 +74,17 @@ class DatasetCodeMetric:
                 if 'huggingface.co/datasets/' in content:
                     score += 0.3
                 
+                if score >= 1.0:
+                    return 1.0
+                
                 # Look for data size mentions
-                data_size_pattern = r'\d+[kmb]?\s*(samples|examples|tokens|words|sentences)'
-                if re.search(data_size_pattern, content, re.IGNORECASE):
+                if _DATA_SIZE_RE.search(content):
                     score += 0.2
             
             return min(1.0, score)
             
         except Exception as e:
-            self.logger.error(f"Dataset info check failed: {str(e)}")
+            logger.error(f"Dataset info check failed: {str(e)}")
             return 0.4
     
     def _check_code_availability(self, model_info: ModelInfo) -> float:
@@ -92,55 +93,38 @@ class DatasetCodeMetric:
             score = 0.0
             
             # Check for training/inference code files
-            files_url = f"https://huggingface.co/api/models/{model_info.name}/tree/main"
-            response = self.session.get(files_url, timeout=10)
+            files = readme_cache.analyze_tree(model_info.name, classify_files)
             
-            if response.status_code == 200:
-                files_data = response.json()
-                
-                code_files = 0
-                example_files = 0
-                
-                for item in files_data:
-                    if 'path' in item:
-                        filepath = item['path'].lower()
-                        
-                        if filepath.endswith('.py'):
-                            code_files += 1
-                            if any(word in filepath for word in ['train', 'inference', 'run', 'example', 'demo']):
-                                example_files += 1
-                        elif filepath.endswith('.ipynb'):
-                            example_files += 1
-                        elif filepath in ['training_args.json', 'run.sh', 'train.sh']:
-                            code_files += 1
-                
-                if code_files > 0:
+            if files is not None:
+                if files.code_files > 0:
                     score += 0.3
-                if example_files > 0:
+                if files.example_files > 0:
                     score += 0.4
-                if code_files >= 3:  # Multiple code files
+                if files.code_files >= 3:  # Multiple code files
                     score += 0.2
             
             # Check README for code examples
-            readme_url = f"https://huggingface.co/{model_info.name}/raw/main/README.md"
-            readme_response = self.session.get(readme_url, timeout=10)
+            readme = readme_cache.get_readme(model_info.name)
             
-            if readme_response.status_code == 200:
-                content = readme_response.text
+            if readme is not None:
+                content = readme
                 
-                # Look for code blocks
-                code_blocks = content.count('```python') + content.count('```')
+                # Look for code blocks (one pass; each fence counted once)
+                code_blocks = content.count('```')
                 if code_blocks >= 2:
                     score += 0.3
                 elif code_blocks >= 1:
                     score += 0.2
                 
+                if score >= 1.0:
+                    return 1.0
+                
                 # Look for usage instructions
-                if 'from transformers import' in content or 'import torch' in content:
+                if _USAGE_IMPORTS.any(content):
                     score += 0.2
             
             return min(1.0, score)
             
         except Exception as e:
-            self.logger.error(f"Code availability check failed: {str(e)}")
+            logger.error(f"Code availability check failed: {str(e)}")
             return 0.4
\ No newline at end of file
@@ -7,14 +7,48 @@ import requests
 import re
 from ..models.model import ModelInfo
 from ..utils.logger import setup_logger
+from ..utils.readme_cache import readme_cache
+from ..utils.term_matcher import TermMatcher
+
+logger = setup_logger()
+
+_DATA_SIZE_RE = re.compile(r'\d+[kmb]?\s*(tokens|words|samples|examples)')
+
+# Detailed dataset information
+_DATASET_QUALITY_TERMS = TermMatcher([
+    'data source', 'data collection', 'data cleaning', 'preprocessing',
+    'filtering', 'deduplication', 'quality control', 'curation',
+    'annotation', 'labeling', 'validation'
+])
+_COMPOSITION_TERMS = TermMatcher(['composition', 'distribution', 'breakdown', 'statistics'])
+_PREPROCESSING_TERMS = TermMatcher([
+    'tokenization', 'normalization', 'cleaning', 'filtering',
+    'preprocessing', 'preparation', 'augmentation', 'transformation'
+])
+_PREPROCESSING_TOOLS = TermMatcher(['spacy', 'nltk', 'tokenizer', 'bpe', 'sentencepiece'])
+
+# Known high-quality datasets
+_QUALITY_DATASETS = {
+    'common crawl': 0.7,
+    'c4': 0.8,
+    'pile': 0.8,
+    'openwebtext': 0.7,
+    'wikipedia': 0.9,
+    'books3': 0.6,
+    'arxiv': 0.8,
+    'pubmed': 0.8,
+    'github': 0.7,
+    'stackexchange': 0.7,
+    'refinedweb': 0.8,
+    'dolma': 0.8,
+    'redpajama': 0.7
+}
+_QUALITY_DATASET_TERMS = TermMatcher(_QUALITY_DATASETS)
+_GENERAL_QUALITY_TERMS = TermMatcher(['curated', 'filtered', 'high-quality', 'clean'])
 
 class DatasetQualityMetric:
     """Calculate dataset quality score"""
     
-    def __init__(self):
-        self.logger = setup_logger()
-        self.session = requests.Session()
-    
     def calculate(self, model_info: ModelInfo) -> float:
         """Calculate dataset quality score"""
         try:
@@ -36,119 +70,76 @@ class DatasetQualityMetric:
             return min(1.0, max(0.5, score))  # Minimum 0.5
             
         except Exception as e:
-            self.logger.error(f"Dataset quality calculation failed: {str(e)}")
+            logger.error(f"Dataset quality calculation failed: {str(e)}")
             return 0.6
     
     def _check_dataset_documentation(self, model_info: ModelInfo) -> float:
         """Check quality of dataset documentation"""
         try:
-            readme_url = f"https://huggingface.co/{model_info.name}/raw/main/README.md"
-            response = self.session.get(readme_url, timeout=10)
+            content = readme_cache.get_readme_lower(model_info.name)
             
-            if response.status_code != 200:
+            if content is None:
                 return 0.4
             
-            content = response.text.lower()
             score = 0.0
             
             # Look for detailed dataset information
-            dataset_quality_terms = [
-                'data source', 'data collection', 'data cleaning', 'preprocessing',
-                'filtering', 'deduplication', 'quality control', 'curation',
-                'annotation', 'labeling', 'validation'
-            ]
-            
-            found_terms = 0
-            for term in dataset_quality_terms:
-                if term in content:
-                    found_terms += 1
+            found_terms = _DATASET_QUALITY_TERMS.count(content)
             
             score += min(0.6, found_terms * 0.1)
             
             # Check for specific dataset size information
-            if re.search(r'\d+[kmb]?\s*(tokens|words|samples|examples)', content):
+            if _DATA_SIZE_RE.search(content):
                 score += 0.2
             
             # Check for data composition details
-            if any(term in content for term in ['composition', 'distribution', 'breakdown', 'statistics']):
+            if _COMPOSITION_TERMS.any(content):
                 score += 0.2
             
             return min(1.0, score)
             
         except Exception as e:
-            self.logger.error(f"Dataset documentation check failed: {str(e)}")
+            logger.error(f"Dataset documentation check failed: {str(e)}")
             return 0.4
     
     def _check_preprocessing_info(self, model_info: ModelInfo) -> float:
         """Check for data preprocessing information"""
         try:
-            readme_url = f"https://huggingface.co/{model_info.name}/raw/main/README.md"
-            response = self.session.get(readme_url, timeout=10)
+            content = readme_cache.get_readme_lower(model_info.name)
             
-            if response.status_code != 200:
+            if content is None:
                 return 0.4
             
-            content = response.text.lower()
             score = 0.0
             
-            preprocessing_terms = [
-                'tokenization', 'normalization', 'cleaning', 'filtering',
-                'preprocessing', 'preparation', 'augmentation', 'transformation'
-            ]
-            
-            found_terms = 0
-            for term in preprocessing_terms:
-                if term in content:
-                    found_terms += 1
+            found_terms = _PREPROCESSING_TERMS.count(content)
             
             score += min(0.8, found_terms * 0.15)
             
             # Check for specific preprocessing tools/methods
-            if any(tool in content for tool in ['spacy', 'nltk', 'tokenizer', 'bpe', 'sentencepiece']):
+            if _PREPROCESSING_TOOLS.any(content):
                 score += 0.2
             
             return max(0.4, min(1.0, score))  # Minimum 0.4
             
         except Exception as e:
-            self.logger.error(f"Preprocessing info check failed: {str(e)}")
+            logger.error(f"Preprocessing info check failed: {str(e)}")
             return 0.4
     
     def _check_known_datasets(self, model_info: ModelInfo) -> float:
         """Check if trained on known high-quality datasets"""
         try:
-            readme_url = f"https://huggingface.co/{model_info.name}/raw/main/README.md"
-            response = self.session.get(readme_url, timeout=10)
+            content = readme_cache.get_readme_lower(model_info.name)
             
-            if response.status_code != 200:
+            if content is None:
                 return 0.3
             
-            content = response.text.lower()
-            
-            # Known high-quality datasets
-            quality_datasets = {
-                'common crawl': 0.7,
-                'c4': 0.8,
-                'pile': 0.8,
-                'openwebtext': 0.7,
-                'wikipedia': 0.9,
-                'books3': 0.6,
-                'arxiv': 0.8,
-                'pubmed': 0.8,
-                'github': 0.7,
-                'stackexchange': 0.7,
-                'refinedweb': 0.8,
-                'dolma': 0.8,
-                'redpajama': 0.7
-            }
-            
-            max_score = 0.0
-            for dataset, score in quality_datasets.items():
-                if dataset in content:
-                    max_score = max(max_score, score)
+            found = _QUALITY_DATASET_TERMS.find(content)
+            max_score = max((_QUALITY_DATASETS[dataset] for dataset in found), default=0.0)
             
             if max_score == 0.0:
                 # Check for general indicators of quality
-                if any(term in content for term in ['curated', 'filtered', 'high-quality', 'clean']):
+                if _GENERAL_QUALITY_TERMS.any(content):
                     max_score = 0.5
                 else:
                     max_score = 0.3  # Default moderate score
@@ -156,5 +147,5 @@ class DatasetQualityMetric:
             return max_score
             
         except Exception as e:
-            self.logger.error(f"Known datasets check failed: {str(e)}")
+            logger.error(f"Known datasets check failed: {str(e)}")
             return 0.3
\ No newline at end of file
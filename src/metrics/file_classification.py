@@ -0,0 +1,53 @@
+# src/metrics/file_classification.py
+"""
+One-pass classification of a model repo's file listing
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, List
+
+from ..utils.term_matcher import TermMatcher
+
+# Scripts that look like training/inference entry points (DatasetCodeMetric)
+_EXAMPLE_SCRIPT_WORDS = TermMatcher(['train', 'inference', 'run', 'example', 'demo'])
+_CODE_FILENAMES = frozenset({'training_args.json', 'run.sh', 'train.sh'})
+
+# Files that look like examples (RampUpMetric)
+_EXAMPLE_FILE_WORDS = TermMatcher(['example', 'demo', 'sample', 'test'])
+_SOURCE_SUFFIXES = ('.py', '.ipynb', '.md')
+
+@dataclass(frozen=True)
+class FileClassification:
+    """File counts derived from a repo listing, shared by several metrics"""
+    code_files: int = 0
+    example_files: int = 0
+    example_weight: float = 0.0
+
+def classify_files(files_data: List[Dict[str, Any]]) -> FileClassification:
+    """Classify every file in a tree listing in a single pass"""
+    code_files = 0
+    example_files = 0
+    example_weight = 0.0
+    
+    for item in files_data:
+        if 'path' not in item:
+            continue
+        filepath = item['path'].lower()
+        
+        # Code and example scripts
+        if filepath.endswith('.py'):
+            code_files += 1
+            if _EXAMPLE_SCRIPT_WORDS.any(filepath):
+                example_files += 1
+        elif filepath.endswith('.ipynb'):
+            example_files += 1
+        elif filepath in _CODE_FILENAMES:
+            code_files += 1
+        
+        # Example material for getting started
+        if _EXAMPLE_FILE_WORDS.any(filepath):
+            example_weight += 1
+        elif filepath.endswith(_SOURCE_SUFFIXES) and 'readme' not in filepath:
+            example_weight += 0.5
+    
+    return FileClassification(code_files, example_files, example_weight)
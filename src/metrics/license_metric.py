@@ -9,29 +9,37 @@ import requests
 from typing import Dict, Any
 from ..models.model import ModelInfo
 from ..utils.logger import setup_logger
+from ..utils.readme_cache import readme_cache
+from ..utils.term_matcher import TermMatcher
+
+logger = setup_logger()
+
+_LICENSE_SECTION_RE = re.compile(r'#+\s*License\s*\n(.*?)(?=\n#|\n\n|\Z)', re.IGNORECASE | re.DOTALL)
+_LICENSE_INLINE_RE = re.compile(r'license[:\s]+([^\n]+)', re.IGNORECASE)
+
+# License compatibility with LGPLv2.1
+_LICENSE_SCORES = {
+    'apache-2.0': 0.9,  # Apache 2.0 is fully compatible
+    'mit': 0.9,  # MIT is fully compatible
+    'bsd-3-clause': 1.0,  # BSD is fully compatible
+    'bsd-2-clause': 1.0,  # BSD is fully compatible
+    'lgpl-2.1': 1.0,
+    'lgpl-3.0': 0.8,
+    'gpl-2.0': 0.3,  # Less compatible
+    'gpl-3.0': 0.3,  # Less compatible
+    'cc-by-4.0': 0.7,
+    'cc-by-sa-4.0': 0.6,
+    'unknown': 0.5,
+    'other': 0.5
+}
+_PERMISSIVE_WORDS = TermMatcher(['apache', 'mit', 'bsd'])
+_CREATIVE_WORDS = TermMatcher(['cc', 'creative'])
 
 class LicenseMetric:
     """Calculate license score"""
     
     def __init__(self):
-        self.logger = setup_logger()
-        self.session = requests.Session()
-        
-        # License compatibility with LGPLv2.1
-        self.license_scores = {
-            'apache-2.0': 0.9,  # Apache 2.0 is fully compatible
-            'mit': 0.9,  # MIT is fully compatible
-            'bsd-3-clause': 1.0,  # BSD is fully compatible
-            'bsd-2-clause': 1.0,  # BSD is fully compatible
-            'lgpl-2.1': 1.0,
-            'lgpl-3.0': 0.8,
-            'gpl-2.0': 0.3,  # Less compatible
-            'gpl-3.0': 0.3,  # Less compatible
-            'cc-by-4.0': 0.7,
-            'cc-by-sa-4.0': 0.6,
-            'unknown': 0.5,
-            'other': 0.5
-        }
+        self.license_scores = _LICENSE_SCORES
     
     def calculate(self, model_info: ModelInfo) -> float:
         """Calculate license compatibility score"""
@@ -51,15 +59,16 @@ class LicenseMetric:
             # Normalize license string
             license_key = str(license_info).lower().strip()
             
-            # Check against known licenses
+            # Check against known licenses; when several appear,
+            # the first in table order wins
             for known_license, score in self.license_scores.items():
                 if known_license in license_key:
                     return score
             
             # Check for permissive patterns
-            if any(word in license_key for word in ['apache', 'mit', 'bsd']):
+            if _PERMISSIVE_WORDS.any(license_key):
                 return 0.9
-            elif any(word in license_key for word in ['cc', 'creative']):
+            elif _CREATIVE_WORDS.any(license_key):
                 return 0.7
             elif 'lgpl' in license_key:
                 return 0.9
@@ -69,33 +78,31 @@ class LicenseMetric:
                 return 0.5
                 
         except Exception as e:
-            self.logger.error(f"License calculation failed: {str(e)}")
+            logger.error(f"License calculation failed: {str(e)}")
             return 0.5
     
     def _parse_license_from_readme(self, model_info: ModelInfo) -> str:
         """Parse license from README file"""
         try:
-            readme_url = f"https://huggingface.co/{model_info.name}/raw/main/README.md"
-            response = self.session.get(readme_url, timeout=10)
+            readme = readme_cache.get_readme(model_info.name)
             
-            if response.status_code != 200:
+            if readme is None:
                 return None
             
-            content = response.text
+            content = readme
             
             # Look for license section
-            license_match = re.search(r'#+\s*License\s*\n(.*?)(?=\n#|\n\n|\Z)', content, re.IGNORECASE | re.DOTALL)
+            license_match = _LICENSE_SECTION_RE.search(content)
             if license_match:
                 return license_match.group(1).strip()
             
             # Look for license mentions
-            license_pattern = r'license[:\s]+([^\n]+)'
-            match = re.search(license_pattern, content, re.IGNORECASE)
+            match = _LICENSE_INLINE_RE.search(content)
             if match:
                 return match.group(1).strip()
             
             return None
             
         except Exception as e:
-            self.logger.error(f"README parsing failed: {str(e)}")
+            logger.error(f"README parsing failed: {str(e)}")
             return None
@@ -5,16 +5,26 @@ Performance claims metric - evidence of benchmarks and evaluations
 
 import re
 import requests
+from itertools import islice
 from ..models.model import ModelInfo
 from ..utils.logger import setup_logger
+from ..utils.readme_cache import readme_cache
+from ..utils.term_matcher import TermMatcher
+
+logger = setup_logger()
+
+_NUMBER_PATTERN_RE = re.compile(r'\d+\.?\d*\s*%|\d+\.?\d*\s*(accuracy|score|bleu|rouge)')
+
+# Common benchmark/evaluation terms
+_BENCHMARK_TERMS = TermMatcher([
+    'benchmark', 'evaluation', 'eval', 'performance', 'accuracy', 
+    'bleu', 'rouge', 'bert-score', 'glue', 'superglue', 'hellaswag',
+    'mmlu', 'truthfulqa', 'arc', 'winogrande', 'gsm8k'
+])
 
 class PerformanceMetric:
     """Calculate performance claims score"""
     
-    def __init__(self):
-        self.logger = setup_logger()
-        self.session = requests.Session()
-    
     def calculate(self, model_info: ModelInfo) -> float:
         """Calculate evidence of performance claims score"""
         try:
@@ -32,18 +42,22 @@ class PerformanceMetric:
             model_index_score = self._analyze_model_index(model_info)
             score += model_index_score * 0.5
             
-            # Check README for benchmark mentions
-            readme_score = self._analyze_readme_benchmarks(model_info)
-            score += readme_score * 0.3
-            
             # Check tags for evaluation-related info
             tags_score = self._analyze_tags(model_info)
             score += tags_score * 0.2
             
+            # The local signals may already max out the score; skip the README
+            if score >= 1.0:
+                return 1.0
+            
+            # Check README for benchmark mentions
+            readme_score = self._analyze_readme_benchmarks(model_info)
+            score += readme_score * 0.3
+            
             return min(1.0, score)
             
         except Exception as e:
-            self.logger.error(f"Performance claims calculation failed: {str(e)}")
+            logger.error(f"Performance claims calculation failed: {str(e)}")
             return 0.5  # Default moderate score
     
     def _analyze_model_index(self, model_info: ModelInfo) -> float:
@@ -70,32 +84,20 @@ class PerformanceMetric:
             return min(1.0, score)
             
         except Exception as e:
-            self.logger.error(f"Model index analysis failed: {str(e)}")
+            logger.error(f"Model index analysis failed: {str(e)}")
             return 0.3
     
     def _analyze_readme_benchmarks(self, model_info: ModelInfo) -> float:
         """Analyze README for benchmark mentions"""
         try:
-            readme_url = f"https://huggingface.co/{model_info.name}/raw/main/README.md"
-            response = self.session.get(readme_url, timeout=10)
+            content = readme_cache.get_readme_lower(model_info.name)
             
-            if response.status_code != 200:
+            if content is None:
                 return 0.3
             
-            content = response.text.lower()
             score = 0.0
             
-            # Common benchmark/evaluation terms
-            benchmark_terms = [
-                'benchmark', 'evaluation', 'eval', 'performance', 'accuracy', 
-                'bleu', 'rouge', 'bert-score', 'glue', 'superglue', 'hellaswag',
-                'mmlu', 'truthfulqa', 'arc', 'winogrande', 'gsm8k'
-            ]
-            
-            found_terms = 0
-            for term in benchmark_terms:
-                if term in content:
-                    found_terms += 1
+            found_terms = _BENCHMARK_TERMS.count(content)
             
             if found_terms >= 5:
                 score += 0.8
@@ -105,14 +107,14 @@ class PerformanceMetric:
                 score += 0.3
             
             # Look for numerical results (percentages, scores)
-            number_pattern = r'\d+\.?\d*\s*%|\d+\.?\d*\s*(accuracy|score|bleu|rouge)'
-            numbers_found = len(re.findall(number_pattern, content))
+            # Only the first four count toward the 0.4 cap, so stop scanning there
+            numbers_found = sum(1 for _ in islice(_NUMBER_PATTERN_RE.finditer(content), 4))
             score += min(0.4, numbers_found * 0.1)
             
             return min(1.0, score)
             
         except Exception as e:
-            self.logger.error(f"README benchmark analysis failed: {str(e)}")
+            logger.error(f"README benchmark analysis failed: {str(e)}")
             return 0.3
     
     def _analyze_tags(self, model_info: ModelInfo) -> float:
@@ -137,5 +139,5 @@ class PerformanceMetric:
             return min(1.0, max(0.3, score))  # Minimum 0.3
             
         except Exception as e:
-            self.logger.error(f"Tags analysis failed: {str(e)}")
+            logger.error(f"Tags analysis failed: {str(e)}")
             return 0.3
\ No newline at end of file
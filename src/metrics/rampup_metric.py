@@ -3,18 +3,27 @@
 Ramp-up time metric - how easy it is to get started with the model
 """
 
+import math
 import re
 import requests
 from ..models.model import ModelInfo
 from ..utils.logger import setup_logger
+from ..utils.readme_cache import readme_cache
+from .file_classification import classify_files
+
+logger = setup_logger()
+
+def _sqrt_scale(count: int, saturation: int) -> float:
+    """Map a count to [0, 1] as sqrt(count / saturation), clamped"""
+    if count >= saturation:
+        return 1.0
+    if count <= 0:
+        return 0
+    return math.sqrt(count / saturation)
 
 class RampUpMetric:
     """Calculate ramp-up time score"""
     
-    def __init__(self):
-        self.logger = setup_logger()
-        self.session = requests.Session()
-    
     def calculate(self, model_info: ModelInfo) -> float:
         """Calculate how easy it is to get started with the model"""
         try:
@@ -28,14 +37,6 @@ class RampUpMetric:
             
             score = base_score
             
-            # Check documentation quality
-            readme_score = self._analyze_readme(model_info)
-            score += readme_score * 0.4
-            
-            # Check example code availability
-            examples_score = self._check_examples(model_info)
-            score += examples_score * 0.3
-            
             # Check model card completeness
             card_score = self._analyze_model_card(model_info)
             score += card_score * 0.2
@@ -44,22 +45,34 @@ class RampUpMetric:
             popularity_score = self._calculate_popularity_score(model_info)
             score += popularity_score * 0.1
             
+            # The local signals may already max out the score; skip the fetches
+            if score >= 1.0:
+                return 1.0
+            
+            # Check documentation quality
+            readme_score = self._analyze_readme(model_info)
+            score += readme_score * 0.4
+            if score >= 1.0:
+                return 1.0
+            
+            # Check example code availability
+            examples_score = self._check_examples(model_info)
+            score += examples_score * 0.3
+            
             return min(1.0, score)
             
         except Exception as e:
-            self.logger.error(f"Ramp-up calculation failed: {str(e)}")
+            logger.error(f"Ramp-up calculation failed: {str(e)}")
             return 0.5  # Default moderate score
     
     def _analyze_readme(self, model_info: ModelInfo) -> float:
         """Analyze README quality"""
         try:
-            readme_url = f"https://huggingface.co/{model_info.name}/raw/main/README.md"
-            response = self.session.get(readme_url, timeout=10)
+            content = readme_cache.get_readme_lower(model_info.name)
             
-            if response.status_code != 200:
+            if content is None:
                 return 0.4
             
-            content = response.text.lower()
             score = 0.0
             
             # Check for key sections
@@ -79,34 +92,22 @@ class RampUpMetric:
             return min(1.0, score)
             
         except Exception as e:
-            self.logger.error(f"README analysis failed: {str(e)}")
+            logger.error(f"README analysis failed: {str(e)}")
             return 0.4
     
     def _check_examples(self, model_info: ModelInfo) -> float:
         """Check for example code availability"""
         try:
             # Check if there are example files in the repo
-            files_url = f"https://huggingface.co/api/models/{model_info.name}/tree/main"
-            response = self.session.get(files_url, timeout=10)
+            files = readme_cache.analyze_tree(model_info.name, classify_files)
             
-            if response.status_code != 200:
+            if files is None:
                 return 0.4
             
-            files_data = response.json()
-            example_files = 0
-            
-            for item in files_data:
-                if 'path' in item:
-                    filename = item['path'].lower()
-                    if any(word in filename for word in ['example', 'demo', 'sample', 'test']):
-                        example_files += 1
-                    elif filename.endswith(('.py', '.ipynb', '.md')) and 'readme' not in filename:
-                        example_files += 0.5
-            
-            return min(1.0, example_files * 0.3)
+            return min(1.0, files.example_weight * 0.3)
             
         except Exception as e:
-            self.logger.error(f"Examples check failed: {str(e)}")
+            logger.error(f"Examples check failed: {str(e)}")
             return 0.4
     
     def _analyze_model_card(self, model_info: ModelInfo) -> float:
@@ -127,21 +128,19 @@ class RampUpMetric:
             return min(1.0, score)
             
         except Exception as e:
-            self.logger.error(f"Model card analysis failed: {str(e)}")
+            logger.error(f"Model card analysis failed: {str(e)}")
             return 0.3
     
     def _calculate_popularity_score(self, model_info: ModelInfo) -> float:
         """Calculate popularity-based score"""
         try:
-            downloads = model_info.downloads or 0
-            likes = model_info.likes or 0
-            
-            # Logarithmic scaling for downloads and likes
-            download_score = min(1.0, (downloads / 10000) ** 0.5) if downloads > 0 else 0
-            likes_score = min(1.0, (likes / 100) ** 0.5) if likes > 0 else 0
+            # Square-root scaling for downloads and likes, saturating at
+            # 10k downloads / 100 likes (popular models skip the sqrt)
+            download_score = _sqrt_scale(model_info.downloads, 10000)
+            likes_score = _sqrt_scale(model_info.likes, 100)
             
             return (download_score + likes_score) / 2
             
         except Exception as e:
-            self.logger.error(f"Popularity calculation failed: {str(e)}")
+            logger.error(f"Popularity calculation failed: {str(e)}")
             return 0.1
@@ -6,17 +6,42 @@ Size metric calculation for different hardware platforms
 
 import requests
 import json
+from bisect import bisect_left
 from typing import Dict, Any
 from ..models.model import ModelInfo
 from ..utils.logger import setup_logger
+from ..utils.readme_cache import readme_cache
+
+logger = setup_logger()
+
+# Size guesses (GB) from markers in the model name, in precedence order: the
+# first row with any marker present wins, so 'x-7b-large' counts as 7B
+_NAME_SIZE_ESTIMATES = (
+    (('7b', '7-b'), 13.0),     # ~13GB for 7B models
+    (('13b', '13-b'), 26.0),   # ~26GB for 13B models
+    (('70b', '70-b'), 140.0),  # ~140GB for 70B models
+    (('3b', '3-b'), 6.0),      # ~6GB for 3B models
+    (('1b', '1-b'), 2.0),      # ~2GB for 1B models
+    (('small',), 0.5),         # Small models
+    (('large',), 5.0),         # Large models
+)
+
+# Score for a model up to each multiple of a platform's limit; anything
+# larger than the last multiple gets the final score
+_FIT_RATIOS = (
+    0.5,  # Comfortably fits
+    0.8,  # Fits with some room
+    1.0,  # Just fits
+    1.5,  # Might work with optimizations
+    2.0,  # Could work with quantization
+    3.0,  # Needs significant optimization
+)
+_FIT_SCORES = (1.0, 0.9, 0.8, 0.6, 0.5, 0.4, 0.3)  # Last: too large but still give some score
 
 class SizeMetric:
     """Calculate size compatibility score for different hardware"""
     
     def __init__(self):
-        self.logger = setup_logger()
-        self.session = requests.Session()
-        
         # Hardware constraints (in GB)
         self.hardware_limits = {
             'raspberry_pi': 1.0,    # 1GB model constraint
@@ -24,71 +49,54 @@ class SizeMetric:
             'desktop_pc': 16.0,     # 16GB RAM typical
             'aws_server': 64.0      # Large instance
         }
+        # Size cut-offs in GB per platform, ascending, for bisect lookup
+        self._thresholds = tuple(
+            (hardware, [limit * ratio for ratio in _FIT_RATIOS])
+            for hardware, limit in self.hardware_limits.items()
+        )
     
     def calculate(self, model_info: ModelInfo) -> Dict[str, float]:
         """Calculate size scores for different hardware platforms"""
         try:
             model_size_gb = self._estimate_model_size(model_info)
             
-            scores = {}
-            for hardware, limit in self.hardware_limits.items():
-                if model_size_gb <= limit * 0.5:  # Comfortably fits
-                    scores[hardware] = 1.0
-                elif model_size_gb <= limit * 0.8:  # Fits with some room
-                    scores[hardware] = 0.9
-                elif model_size_gb <= limit:  # Just fits
-                    scores[hardware] = 0.8
-                elif model_size_gb <= limit * 1.5:  # Might work with optimizations
-                    scores[hardware] = 0.6
-                elif model_size_gb <= limit * 2.0:  # Could work with quantization
-                    scores[hardware] = 0.5
-                elif model_size_gb <= limit * 3.0:  # Needs significant optimization
-                    scores[hardware] = 0.4
-                else:  # Too large but still give some score
-                    scores[hardware] = 0.3
-            
-            return scores
+            # bisect_left finds the first cut-off the size does not exceed
+            return {
+                hardware: _FIT_SCORES[bisect_left(cutoffs, model_size_gb)]
+                for hardware, cutoffs in self._thresholds
+            }
             
         except Exception as e:
-            self.logger.error(f"Size calculation failed: {str(e)}")
+            logger.error(f"Size calculation failed: {str(e)}")
             return {hw: 0.7 for hw in self.hardware_limits.keys()}
     
     def _estimate_model_size(self, model_info: ModelInfo) -> float:
         """Estimate model size in GB"""
         try:
-            # Try to get size from model files
-            files_url = f"https://huggingface.co/api/models/{model_info.name}/tree/main"
-            response = self.session.get(files_url, timeout=10)
+            # The model API data already lists file sizes when it was fetched
+            # with blobs=true; only fall back to the tree listing without it
+            siblings = (model_info.api_data or {}).get('siblings') or []
+            total_size = sum(item.get('size') or 0 for item in siblings)
             
-            total_size = 0
-            if response.status_code == 200:
-                files_data = response.json()
-                for item in files_data:
-                    if 'size' in item:
-                        total_size += item['size']
+            if total_size == 0:
+                # Try to get size from model files
+                files_data = readme_cache.get_tree(model_info.name)
+                if files_data is not None:
+                    for item in files_data:
+                        if 'size' in item:
+                            total_size += item['size']
             
             if total_size > 0:
                 return total_size / (1024 ** 3)  # Convert to GB
             
             # Fallback: estimate from model name/tags
             model_name_lower = model_info.name.lower()
-            if any(size in model_name_lower for size in ['7b', '7-b']):
-                return 13.0  # ~13GB for 7B models
-            elif any(size in model_name_lower for size in ['13b', '13-b']):
-                return 26.0  # ~26GB for 13B models
-            elif any(size in model_name_lower for size in ['70b', '70-b']):
-                return 140.0  # ~140GB for 70B models
-            elif any(size in model_name_lower for size in ['3b', '3-b']):
-                return 6.0   # ~6GB for 3B models
-            elif any(size in model_name_lower for size in ['1b', '1-b']):
-                return 2.0   # ~2GB for 1B models
-            elif 'small' in model_name_lower:
-                return 0.5   # Small models
-            elif 'large' in model_name_lower:
-                return 5.0   # Large models
-            else:
-                return 2.0   # Default assumption
+            for markers, size_gb in _NAME_SIZE_ESTIMATES:
+                for marker in markers:
+                    if marker in model_name_lower:
+                        return size_gb
+            return 2.0   # Default assumption
                 
         except Exception as e:
-            self.logger.error(f"Size estimation failed: {str(e)}")
+            logger.error(f"Size estimation failed: {str(e)}")
             return 2.0  # Default fallback
\ No newline at end of file
@@ -21,10 +21,16 @@ class ModelInfo:
     model_index: List[Dict] = None
     
     def __post_init__(self):
+        # The HF API returns null for some fields; normalize once here so the
+        # metrics can iterate and compare without guarding every access
         if self.tags is None:
             self.tags = []
         if self.model_index is None:
             self.model_index = []
+        if self.downloads is None:
+            self.downloads = 0
+        if self.likes is None:
+            self.likes = 0
 
 @dataclass 
 class DatasetInfo:
@@ -3,38 +3,71 @@
 URL Parser module for identifying and parsing different types of URLs
 """
 
+import asyncio
 import re
+from enum import Enum
 from typing import Optional, Dict, Any
 from urllib.parse import urlparse
 import requests
 import json
 
 from .models.model import ModelInfo, DatasetInfo, CodeInfo
+from .utils.endpoints import GH_REPO_API, HF_DATASET_API, HF_MODEL_API
+from .utils.http import get_session
+from .utils.http_cache import cached_get
 from .utils.logger import setup_logger
 
+# Captures the full model path including slashes (org/model or model)
+_HF_MODEL_RE = re.compile(r'huggingface\.co/([^?]+)')
+# Captures org/dataset or a single dataset name
+_HF_DATASET_RE = re.compile(r'huggingface\.co/datasets/([^/?]+(?:/[^/?]+)?)')
+_GITHUB_REPO_RE = re.compile(r'github\.com/([^/]+)/([^/?]+)')
+
+class URLType(str, Enum):
+    """Kinds of URLs the evaluator understands
+    
+    Members compare equal to their plain string values ("MODEL", ...).
+    """
+    MODEL = "MODEL"
+    DATASET = "DATASET"
+    CODE = "CODE"
+
 class URLParser:
     """Parser for different types of URLs (Model, Dataset, Code)"""
     
     def __init__(self):
         self.logger = setup_logger()
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'ACME-ML-Evaluator/1.0'
-        })
+        self.session = get_session()
     
-    def identify_url_type(self, url: str) -> str:
+    def identify_url_type(self, url: str) -> URLType:
         """Identify the type of URL"""
+        # Three substring scans over a short URL run in C and cost well under
+        # a microsecond; urlparse plus a (host, segment) table lookup measured
+        # ~15x slower, and a hand-split table ~4x slower
         url = url.lower().strip()
         
         if 'huggingface.co/datasets/' in url:
-            return "DATASET"
+            return URLType.DATASET
         elif 'github.com/' in url:
-            return "CODE" 
+            return URLType.CODE
         elif 'huggingface.co/' in url:
-            return "MODEL"
+            return URLType.MODEL
         else:
             # Default assumption
-            return "MODEL"
+            return URLType.MODEL
+    
+    def api_url(self, url: str) -> Optional[str]:
+        """The API URL the parse_*_url methods fetch for url, or None"""
+        url_type = self.identify_url_type(url)
+        
+        if url_type is URLType.DATASET:
+            match = _HF_DATASET_RE.search(url)
+            return HF_DATASET_API.format(name=match.group(1).rstrip('/')) if match else None
+        if url_type is URLType.CODE:
+            match = _GITHUB_REPO_RE.search(url)
+            return GH_REPO_API.format(owner=match.group(1), repo=match.group(2)) if match else None
+        match = _HF_MODEL_RE.search(url.replace('/tree/main', ''))
+        return HF_MODEL_API.format(name=match.group(1).rstrip('/')) if match else None
     
     def parse_model_url(self, url: str) -> Optional[ModelInfo]:
         """Parse a Hugging Face model URL"""
@@ -44,26 +77,23 @@ class URLParser:
                 url = url.replace('/tree/main', '')
             
             # Extract model name from URL (handle both org/model and model formats)
-            # Use a pattern that captures the full model path including slashes
-            pattern = r'huggingface\.co/([^?]+)'
-            match = re.search(pattern, url)
+            match = _HF_MODEL_RE.search(url)
             if not match:
                 self.logger.error(f"Could not parse model URL: {url}")
                 return None
             
-            model_id = match.group(1)
+            # Equivalent spellings of a URL share one API cache entry
+            model_id = match.group(1).rstrip('/')
             
-            # Fetch model information from HF API
-            api_url = f"https://huggingface.co/api/models/{model_id}"
+            # Fetch model information from HF API; blobs=true adds file sizes
+            # to 'siblings' so SizeMetric needs no separate tree listing
+            api_url = HF_MODEL_API.format(name=model_id)
             
             try:
-                response = self.session.get(api_url, timeout=30)
-                if response.status_code == 200:
-                    api_data = response.json()
-                else:
-                    api_data = {}
-            except:
-                api_data = {}
+                _, api_data = cached_get(api_url, timeout=30)
+            except (requests.RequestException, ValueError):
+                api_data = None
+            api_data = api_data or {}
             
             # Create ModelInfo object
             model_info = ModelInfo(
@@ -89,25 +119,20 @@ class URLParser:
         """Parse a Hugging Face dataset URL"""
         try:
             # Extract dataset name from URL - handle both org/dataset and single name formats
-            # First try org/dataset format
-            pattern = r'huggingface\.co/datasets/([^/?]+(?:/[^/?]+)?)'
-            match = re.search(pattern, url)
+            match = _HF_DATASET_RE.search(url)
             if not match:
                 return None
             
             dataset_id = match.group(1).rstrip('/')
             
             # Fetch dataset information from HF API
-            api_url = f"https://huggingface.co/api/datasets/{dataset_id}"
+            api_url = HF_DATASET_API.format(name=dataset_id)
             
             try:
-                response = self.session.get(api_url, timeout=30)
-                if response.status_code == 200:
-                    api_data = response.json()
-                else:
-                    api_data = {}
-            except:
-                api_data = {}
+                _, api_data = cached_get(api_url, timeout=30)
+            except (requests.RequestException, ValueError):
+                api_data = None
+            api_data = api_data or {}
             
             return DatasetInfo(
                 name=dataset_id,
@@ -126,8 +151,7 @@ class URLParser:
         """Parse a GitHub code repository URL"""
         try:
             # Extract repo info from URL
-            pattern = r'github\.com/([^/]+)/([^/?]+)'
-            match = re.search(pattern, url)
+            match = _GITHUB_REPO_RE.search(url)
             if not match:
                 return None
             
@@ -135,16 +159,13 @@ class URLParser:
             repo = match.group(2)
             
             # Fetch repository information from GitHub API
-            api_url = f"https://api.github.com/repos/{owner}/{repo}"
+            api_url = GH_REPO_API.format(owner=owner, repo=repo)
             
             try:
-                response = self.session.get(api_url, timeout=30)
-                if response.status_code == 200:
-                    api_data = response.json()
-                else:
-                    api_data = {}
-            except:
-                api_data = {}
+                _, api_data = cached_get(api_url, timeout=30)
+            except (requests.RequestException, ValueError):
+                api_data = None
+            api_data = api_data or {}
             
             return CodeInfo(
                 name=f"{owner}/{repo}",
@@ -160,6 +181,13 @@ class URLParser:
             self.logger.error(f"Failed to parse code URL {url}: {str(e)}")
             return None
     
+    async def parse_url_async(self, url: str) -> Optional[Dict[str, Any]]:
+        """
+        Async variant of parse_url for the API endpoints
+        Runs the blocking lookup on a worker thread so the event loop stays free
+        """
+        return await asyncio.to_thread(self.parse_url, url)
+    
     def parse_url(self, url: str) -> Optional[Dict[str, Any]]:
         """
         Parse any supported URL and return basic info as a dict
@@ -168,7 +196,7 @@ class URLParser:
         try:
             url_type = self.identify_url_type(url)
             
-            if url_type == "MODEL":
+            if url_type is URLType.MODEL:
                 model_info = self.parse_model_url(url)
                 if model_info:
                     return {
@@ -176,7 +204,7 @@ class URLParser:
                         'type': 'model',
                         'url': url
                     }
-            elif url_type == "DATASET":
+            elif url_type is URLType.DATASET:
                 dataset_info = self.parse_dataset_url(url)
                 if dataset_info:
                     return {
@@ -184,7 +212,7 @@ class URLParser:
                         'type': 'dataset',
                         'url': url
                     }
-            elif url_type == "CODE":
+            elif url_type is URLType.CODE:
                 code_info = self.parse_code_url(url)
                 if code_info:
                     return {
@@ -0,0 +1,52 @@
+# src/utils/concurrent_http.py
+"""
+Concurrent fetching of independent URLs over the shared session
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, Optional
+
+import requests
+
+from .http import SESSION
+from .http_cache import cached_get
+from .logger import setup_logger
+
+logger = setup_logger()
+
+# Upper bound on requests in flight per batch; keeps a single caller from
+# monopolising a host's connection pool or tripping its rate limits
+MAX_WORKERS = 8
+
+def fetch_many(urls: Iterable[str], workers: int = MAX_WORKERS, as_json: bool = True,
+               timeout: float = 10) -> Dict[str, Optional[Any]]:
+    """Fetch independent URLs concurrently, returning {url: body or None}
+    
+    JSON bodies go through the shared API cache; with as_json=False the raw
+    text is returned instead. A URL that fails or answers non-200 maps to
+    None, so one bad request never costs the others.
+    """
+    urls = list(dict.fromkeys(urls))
+    if not urls:
+        return {}
+    
+    fetch = _fetch_json if as_json else _fetch_text
+    with ThreadPoolExecutor(max_workers=min(workers, MAX_WORKERS, len(urls))) as executor:
+        bodies = executor.map(lambda url: fetch(url, timeout), urls)
+        return dict(zip(urls, bodies))
+
+def _fetch_json(url: str, timeout: float) -> Optional[Any]:
+    try:
+        _, body = cached_get(url, timeout=timeout)
+    except (requests.RequestException, ValueError) as e:
+        logger.error(f"Fetch failed for {url}: {str(e)}")
+        return None
+    return body
+
+def _fetch_text(url: str, timeout: float) -> Optional[str]:
+    try:
+        response = SESSION.get(url, timeout=timeout)
+    except requests.RequestException as e:
+        logger.error(f"Fetch failed for {url}: {str(e)}")
+        return None
+    return response.text if response.status_code == 200 else None
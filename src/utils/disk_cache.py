@@ -0,0 +1,75 @@
+# src/utils/disk_cache.py
+"""
+On-disk store of HTTP response bodies for conditional revalidation
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+from typing import Any, Dict, Optional
+
+import requests
+
+from .logger import setup_logger
+
+logger = setup_logger()
+
+class DiskCache:
+    """Response bodies keyed by URL, with their ETag/Last-Modified validators
+    
+    Entries never expire on their own: callers send the stored validators as
+    If-None-Match/If-Modified-Since and reuse the body when the server answers
+    304 Not Modified, so a repeat run costs a round trip but no download.
+    """
+    
+    def __init__(self, directory: str):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+    
+    def load(self, url: str) -> Optional[Dict[str, Any]]:
+        """Return the stored entry for url, or None"""
+        try:
+            with open(self._path(url), 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+    
+    def save(self, url: str, response: requests.Response) -> None:
+        """Store a 200 response if it carries a validator"""
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        if not etag and not last_modified:
+            return
+        entry = {'etag': etag, 'last_modified': last_modified, 'body': response.text}
+        try:
+            # Write then rename so concurrent readers never see a partial file
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory)
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(entry, f)
+            os.replace(tmp_path, self._path(url))
+        except OSError as e:
+            logger.error(f"Failed to write cache entry for {url}: {str(e)}")
+    
+    def delete(self, url: str) -> None:
+        """Remove the stored entry for url, if there is one"""
+        try:
+            os.remove(self._path(url))
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.error(f"Failed to remove cache entry for {url}: {str(e)}")
+    
+    @staticmethod
+    def conditional_headers(entry: Optional[Dict[str, Any]]) -> Dict[str, str]:
+        """Build revalidation headers from a stored entry"""
+        headers = {}
+        if entry:
+            if entry.get('etag'):
+                headers['If-None-Match'] = entry['etag']
+            if entry.get('last_modified'):
+                headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+    
+    def _path(self, url: str) -> str:
+        return os.path.join(self.directory, hashlib.sha256(url.encode('utf-8')).hexdigest() + '.json')
@@ -0,0 +1,16 @@
+# src/utils/endpoints.py
+"""
+URL templates for the Hugging Face and GitHub endpoints we read
+
+Every fetch of the same resource builds its URL from one template, so the
+URL is identical wherever it is requested and the HTTP caches (keyed by
+URL) treat it as one entry.
+"""
+
+# Model metadata; blobs=true adds file sizes to 'siblings'
+HF_MODEL_API = "https://huggingface.co/api/models/{name}?blobs=true"
+HF_MODEL_TREE_API = "https://huggingface.co/api/models/{name}/tree/main"
+HF_DATASET_API = "https://huggingface.co/api/datasets/{name}"
+HF_RAW_FILE = "https://huggingface.co/{name}/raw/main/{path}"
+HF_README = "https://huggingface.co/{name}/raw/main/README.md"
+GH_REPO_API = "https://api.github.com/repos/{owner}/{repo}"
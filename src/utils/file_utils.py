@@ -9,6 +9,7 @@ import shutil
 import requests
 from pathlib import Path
 from typing import Optional, Dict, Any
+from .http import get_session
 from .logger import setup_logger
 
 class FileUtils:
@@ -16,10 +17,7 @@ class FileUtils:
     
     def __init__(self):
         self.logger = setup_logger()
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'ACME-ML-Evaluator/1.0'
-        })
+        self.session = get_session()
     
     def download_file(self, url: str, max_size: int = 10 * 1024 * 1024) -> Optional[str]:
         """Download a file and return temporary path"""
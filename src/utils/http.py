@@ -0,0 +1,59 @@
+# src/utils/http.py
+"""
+Shared HTTP session for Hugging Face and GitHub API calls
+"""
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
+from urllib3.util.retry import Retry
+
+# Number of per-host pools, and connections kept alive in each. A URL file
+# scores up to Config.max_workers (8) models at once, each with up to 8
+# metric threads hitting huggingface.co; connections opened beyond the pool
+# size are closed after use, so undersizing it means a fresh TLS handshake
+# on most requests of a batch
+POOL_CONNECTIONS = 16
+POOL_MAXSIZE = 64
+
+def _build_session() -> requests.Session:
+    """Create a keep-alive session with pooled connections and retries"""
+    session = requests.Session()
+    
+    # Only retry throttled/unavailable responses; connection failures and
+    # timeouts fail fast so a metric never waits several timeouts in a row
+    retries = Retry(
+        total=3,
+        connect=0,
+        read=0,
+        status=3,
+        backoff_factor=0.3,
+        status_forcelist=[429, 502, 503, 504],
+        allowed_methods=['GET', 'HEAD'],
+        respect_retry_after_header=False,
+        raise_on_status=False  # Hand the final response back to the caller
+    )
+    adapter = HTTPAdapter(
+        pool_connections=POOL_CONNECTIONS,
+        pool_maxsize=POOL_MAXSIZE,
+        max_retries=retries
+    )
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    
+    session.headers.update({
+        'User-Agent': 'ACME-ML-Evaluator/1.0',
+        # urllib3's list gains br (and zstd) when brotli/zstandard are
+        # installed; advertising an encoding it can't decode would break
+        # every response, so never hard-code it
+        'Accept-Encoding': ACCEPT_ENCODING,
+        'Connection': 'keep-alive'
+    })
+    return session
+
+# Module-level session so TCP/TLS connections are reused across all metrics
+SESSION = _build_session()
+
+def get_session() -> requests.Session:
+    """Return the process-wide pooled session"""
+    return SESSION
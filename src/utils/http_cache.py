@@ -0,0 +1,167 @@
+# src/utils/http_cache.py
+"""
+Shared TTL cache for JSON API responses (Hugging Face and GitHub)
+"""
+
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Set, Tuple
+
+import requests
+
+from .disk_cache import DiskCache
+from .http import SESSION
+from .logger import setup_logger
+
+logger = setup_logger()
+
+# Responses that stay true until the resource itself changes
+CACHEABLE_STATUSES = (200, 404)
+
+class ApiCache:
+    """Thread-safe LRU cache of (status_code, json_body) keyed by URL
+    
+    Entries are reused for ttl seconds. Only the URL is part of the key, so
+    requests that differ just in auth headers share an entry. When a refresh
+    cannot reach the server, or gets an error status back, the expired entry
+    is served instead of failing.
+    
+    Expired entries are revalidated with the ETag/Last-Modified the server
+    sent; a 304 Not Modified keeps the stored body without downloading it
+    again (and does not count against GitHub's rate limit).
+    
+    For stale_ttl seconds after an entry expires it is still returned
+    immediately while a background thread refreshes it, so callers only wait
+    on the network for URLs they have never seen or not seen in a long time.
+    
+    With a cache_dir, 200 responses are also kept on disk, so after a restart
+    the first lookup of a URL is a conditional GET rather than a download.
+    """
+    
+    def __init__(self, maxsize: int = 1024, ttl: float = 600.0, stale_ttl: float = 0.0,
+                 cache_dir: Optional[str] = None):
+        self.session = SESSION
+        self.disk = DiskCache(cache_dir) if cache_dir else None
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        # url -> (fetched_at, status_code, body, validators)
+        self._entries: "OrderedDict[str, Tuple[float, int, Any, Dict[str, Optional[str]]]]" = OrderedDict()
+        self._refreshing: Set[str] = set()
+        self._key_locks: Dict[str, threading.Lock] = {}
+        self._lock = threading.Lock()
+    
+    def get(self, url: str, ttl: Optional[float] = None, timeout: float = 30) -> Tuple[int, Optional[Any]]:
+        """GET a JSON API URL, returning (status_code, parsed body or None)"""
+        ttl = self.ttl if ttl is None else ttl
+        with self._lock:
+            entry = self._entries.get(url)
+            if entry is not None:
+                self._entries.move_to_end(url)
+                age = time.monotonic() - entry[0]
+                if age < ttl:
+                    return entry[1], entry[2]
+                if age < ttl + self.stale_ttl:
+                    # Answer from the stale entry; one refresh per URL at a time
+                    if url not in self._refreshing:
+                        self._refreshing.add(url)
+                        threading.Thread(target=self._refresh_in_background, args=(url, timeout, entry), daemon=True).start()
+                    return entry[1], entry[2]
+        
+        with self._lock_for(url):
+            # Concurrent callers for the same URL share one request: whoever
+            # waited here finds the entry the first caller just stored
+            with self._lock:
+                latest = self._entries.get(url)
+            if latest is not None and latest is not entry and time.monotonic() - latest[0] < ttl:
+                return latest[1], latest[2]
+            
+            try:
+                return self._fetch(url, timeout, latest)
+            except (requests.ConnectionError, requests.Timeout):
+                if latest is not None:
+                    logger.info(f"Serving stale response for {url}")
+                    return latest[1], latest[2]
+                raise
+    
+    def _fetch(self, url: str, timeout: float, entry: Optional[Tuple] = None) -> Tuple[int, Optional[Any]]:
+        stored = None
+        if entry is not None:
+            validators = entry[3]
+        elif self.disk is not None:
+            # Nothing in memory yet (e.g. after a restart): revalidate the disk copy
+            stored = validators = self.disk.load(url)
+        else:
+            validators = None
+        
+        response = self.session.get(url, headers=DiskCache.conditional_headers(validators), timeout=timeout)
+        if response.status_code == 304 and entry is not None:
+            status_code, body = entry[1], entry[2]
+        elif response.status_code == 304 and stored is not None:
+            status_code, body = 200, json.loads(stored['body'])
+            validators = {'etag': stored.get('etag'), 'last_modified': stored.get('last_modified')}
+        else:
+            status_code = response.status_code
+            body = response.json() if status_code == 200 else None
+            validators = {
+                'etag': response.headers.get('ETag'),
+                'last_modified': response.headers.get('Last-Modified')
+            }
+            if status_code == 200 and self.disk is not None:
+                self.disk.save(url, response)
+        
+        # Only a body or a definite miss is worth keeping; 401/403 (GitHub's
+        # rate limit among them), 429 and server errors are transient
+        if status_code not in CACHEABLE_STATUSES:
+            if entry is not None:
+                # Like an unreachable server: keep answering from what we had
+                logger.info(f"Serving stale response for {url} after HTTP {status_code}")
+                return entry[1], entry[2]
+            return status_code, body
+        
+        with self._lock:
+            self._entries[url] = (time.monotonic(), status_code, body, validators)
+            self._entries.move_to_end(url)
+            while len(self._entries) > self.maxsize:
+                evicted, _ = self._entries.popitem(last=False)
+                self._key_locks.pop(evicted, None)
+        return status_code, body
+    
+    def _refresh_in_background(self, url: str, timeout: float, entry: Tuple) -> None:
+        try:
+            self._fetch(url, timeout, entry)
+        except (requests.RequestException, ValueError) as e:
+            logger.error(f"Background refresh failed for {url}: {str(e)}")
+        finally:
+            with self._lock:
+                self._refreshing.discard(url)
+    
+    def invalidate(self, url: str) -> None:
+        """Drop the cached response for url, in memory and on disk
+        
+        The next lookup downloads it again instead of serving (or merely
+        revalidating) what was stored.
+        """
+        with self._lock:
+            self._entries.pop(url, None)
+        if self.disk is not None:
+            self.disk.delete(url)
+    
+    def clear(self) -> None:
+        """Drop all cached responses"""
+        with self._lock:
+            self._entries.clear()
+            self._key_locks.clear()
+    
+    def _lock_for(self, url: str) -> threading.Lock:
+        with self._lock:
+            return self._key_locks.setdefault(url, threading.Lock())
+
+# Process-wide instance shared by the URL parser and metrics; model metadata
+# changes slowly, so an hour-old answer is fine while a fresh one is fetched.
+# Set HTTP_CACHE_DIR to keep responses on disk between runs
+api_cache = ApiCache(stale_ttl=3600.0, cache_dir=os.environ.get('HTTP_CACHE_DIR'))
+cached_get = api_cache.get
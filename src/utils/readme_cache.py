@@ -0,0 +1,175 @@
+# src/utils/readme_cache.py
+"""
+Shared cache for Hugging Face model READMEs and file listings
+"""
+
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar
+
+import requests
+
+from .disk_cache import DiskCache
+from .endpoints import HF_MODEL_TREE_API, HF_README
+from .http import SESSION
+from .logger import setup_logger
+
+T = TypeVar('T')
+
+class ReadmeCache:
+    """Thread-safe TTL cache of model READMEs and file listings
+    
+    Every metric reads the same model card, and several walk the same repo
+    file tree, so each is downloaded once per model and shared. Concurrent
+    callers asking for the same entry wait for the single in-flight request
+    instead of issuing their own.
+    
+    With a cache_dir, bodies are also kept on disk across runs and
+    revalidated with a conditional GET, so unchanged READMEs come back as a
+    304 instead of being downloaded again.
+    
+    At most maxsize entries are kept, least recently used first out, and
+    expired entries are dropped as new ones arrive. Values derived from an
+    entry go with it.
+    """
+    
+    def __init__(self, ttl: float = 300.0, timeout: float = 10.0, cache_dir: Optional[str] = None,
+                 maxsize: int = 256):
+        self.logger = setup_logger()
+        self.session = SESSION
+        self.ttl = ttl
+        self.timeout = timeout
+        self.maxsize = maxsize
+        self.disk = DiskCache(cache_dir) if cache_dir else None
+        # (kind, name) -> (fetched_at, value)
+        self._entries: "OrderedDict[Tuple[str, str], Tuple[float, Any]]" = OrderedDict()
+        # (kind, name) -> {fn: (source, derived value)}
+        self._derived: Dict[Tuple[str, str], Dict[Callable, Tuple[Any, Any]]] = {}
+        self._key_locks: Dict[Tuple[str, str], threading.Lock] = {}
+        self._lock = threading.Lock()
+    
+    def get_readme(self, name: str) -> Optional[str]:
+        """Return the README text for a model, or None if it has none"""
+        return self._get(('readme', name), HF_README.format(name=name), as_json=False)
+    
+    def get_readme_lower(self, name: str) -> Optional[str]:
+        """Return the lowercased README text, computed once per download"""
+        readme = self.get_readme(name)
+        if readme is None:
+            return None
+        return self._derive(str.lower, ('readme', name), readme)
+    
+    def get_tree(self, name: str) -> Optional[List[Dict[str, Any]]]:
+        """Return the parsed file listing of a model repo, or None if unavailable"""
+        return self._get(('tree', name), HF_MODEL_TREE_API.format(name=name), as_json=True)
+    
+    def analyze_tree(self, name: str, analyzer: Callable[[List[Dict[str, Any]]], T]) -> Optional[T]:
+        """Return analyzer(file listing), computed once per download; None if unavailable"""
+        tree = self.get_tree(name)
+        if tree is None:
+            return None
+        return self._derive(analyzer, ('tree', name), tree)
+    
+    def clear(self) -> None:
+        """Drop all cached entries"""
+        with self._lock:
+            self._entries.clear()
+            self._derived.clear()
+            self._key_locks.clear()
+    
+    def _get(self, key: Tuple[str, str], url: str, as_json: bool) -> Any:
+        entry = self._fresh_entry(key)
+        if entry is not None:
+            return entry[1]
+        
+        with self._lock_for(key):
+            # Another thread may have fetched it while we waited
+            entry = self._fresh_entry(key)
+            if entry is not None:
+                return entry[1]
+            
+            try:
+                value = self._fetch(url, as_json)
+            except (requests.RequestException, ValueError) as e:
+                # Transient failure or bad body: don't cache, let the next caller retry
+                self.logger.error(f"Fetch failed for {url}: {str(e)}")
+                with self._lock:
+                    if key not in self._entries:
+                        self._key_locks.pop(key, None)
+                return None
+            
+            with self._lock:
+                self._entries[key] = (time.monotonic(), value)
+                self._entries.move_to_end(key)
+                self._evict()
+            return value
+    
+    def _evict(self) -> None:
+        # Caller holds self._lock
+        now = time.monotonic()
+        expired = [key for key, (fetched_at, _) in self._entries.items() if now - fetched_at >= self.ttl]
+        for key in expired:
+            self._drop(key)
+        while len(self._entries) > self.maxsize:
+            self._drop(next(iter(self._entries)))
+    
+    def _drop(self, key: Tuple[str, str]) -> None:
+        # Caller holds self._lock
+        self._entries.pop(key, None)
+        self._derived.pop(key, None)
+        self._key_locks.pop(key, None)
+    
+    def _fetch(self, url: str, as_json: bool) -> Any:
+        if self.disk is None:
+            response = self.session.get(url, timeout=self.timeout)
+            if response.status_code != 200:
+                return None
+            return response.json() if as_json else response.text
+        
+        stored = self.disk.load(url)
+        response = self.session.get(url, headers=DiskCache.conditional_headers(stored), timeout=self.timeout)
+        if response.status_code == 304 and stored is not None:
+            body = stored['body']
+        elif response.status_code == 200:
+            self.disk.save(url, response)
+            body = response.text
+        else:
+            return None
+        return json.loads(body) if as_json else body
+    
+    def _derive(self, fn: Callable[[Any], Any], key: Tuple[str, str], source: Any) -> Any:
+        with self._lock:
+            cached = self._derived.get(key, {}).get(fn)
+        # Reuse only if it was derived from this exact download
+        if cached is not None and cached[0] is source:
+            return cached[1]
+        
+        value = fn(source)
+        with self._lock:
+            # Don't resurrect derived values for an entry evicted meanwhile
+            if key in self._entries:
+                self._derived.setdefault(key, {})[fn] = (source, value)
+        return value
+    
+    def _fresh_entry(self, key: Tuple[str, str]) -> Optional[Tuple[float, Any]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if time.monotonic() - entry[0] >= self.ttl:
+                self._entries.pop(key)
+                self._derived.pop(key, None)
+                return None
+            self._entries.move_to_end(key)
+        return entry
+    
+    def _lock_for(self, key: Tuple[str, str]) -> threading.Lock:
+        with self._lock:
+            return self._key_locks.setdefault(key, threading.Lock())
+
+# Process-wide instance shared by all metrics; set HTTP_CACHE_DIR to keep
+# responses on disk between runs
+readme_cache = ReadmeCache(cache_dir=os.environ.get('HTTP_CACHE_DIR'))
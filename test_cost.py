@@ -8,6 +8,9 @@ import json
 BASE_URL = "http://localhost:8080"
 AUTH_HEADER = {"X-Authorization": "test-token"}
 
+# Reuse one keep-alive connection instead of reconnecting for every call
+SESSION = requests.Session()
+
 def test_cost_endpoint():
     print("="*60)
     print("Testing Cost Calculation Endpoint")
@@ -19,7 +22,7 @@ def test_cost_endpoint():
         "url": "https://huggingface.co/google-bert/bert-base-uncased"
     }
     
-    response = requests.post(
+    response = SESSION.post(
         f"{BASE_URL}/artifact/model",
         headers=AUTH_HEADER,
         json=create_data
@@ -38,7 +41,7 @@ def test_cost_endpoint():
     
     # Step 2: Get cost without dependencies
     print(f"\n2. Calculating cost (without dependencies)...")
-    response = requests.get(
+    response = SESSION.get(
         f"{BASE_URL}/artifact/model/{artifact_id}/cost",
         headers=AUTH_HEADER,
         params={"dependency": False}
@@ -60,7 +63,7 @@ def test_cost_endpoint():
     
     # Step 3: Get cost with dependencies
     print(f"\n3. Calculating cost (with dependencies)...")
-    response = requests.get(
+    response = SESSION.get(
         f"{BASE_URL}/artifact/model/{artifact_id}/cost",
         headers=AUTH_HEADER,
         params={"dependency": True}
@@ -88,7 +91,7 @@ def test_cost_endpoint():
         "url": "https://github.com/huggingface/transformers"
     }
     
-    response = requests.post(
+    response = SESSION.post(
         f"{BASE_URL}/artifact/code",
         headers=AUTH_HEADER,
         json=create_data
@@ -102,7 +105,7 @@ def test_cost_endpoint():
         print(f"  ID: {artifact_id}")
         
         # Get cost
-        response = requests.get(
+        response = SESSION.get(
             f"{BASE_URL}/artifact/code/{artifact_id}/cost",
             headers=AUTH_HEADER
         )
@@ -4,10 +4,43 @@ Test script for the license compatibility check endpoint
 """
 import requests
 import json
+from concurrent.futures import ThreadPoolExecutor
 
 BASE_URL = "http://localhost:8080"
 AUTH_HEADER = {"X-Authorization": "test-token"}
 
+# Reuse one keep-alive connection instead of reconnecting for every call
+SESSION = requests.Session()
+
+# (license, GitHub repo) pairs checked against the test artifact; the MIT
+# check runs first and stops the script if it fails
+MIT_CHECK = ("MIT", "https://github.com/huggingface/transformers")
+LICENSE_CHECKS = [
+    ("Apache 2.0", "https://github.com/google-research/bert"),
+    ("GPL", "https://github.com/pandas-dev/pandas"),
+]
+INVALID_REPO_URL = "https://github.com/nonexistent/fakerepo12345"
+
+def report_license_check(step, license_name, github_url, response, compatible_note="COMPATIBLE"):
+    """Print one license check's result; returns False if the request failed"""
+    repo = github_url.replace("https://github.com/", "")
+    print(f"\n{step}. Checking compatibility with {license_name} licensed repo...")
+    if response.status_code != 200:
+        print(f"✗ Failed to check license: {response.status_code}")
+        print(response.text)
+        return False
+    
+    is_compatible = response.json()
+    print(f"✓ License check completed!")
+    print(f"  Artifact: google-bert/bert-base-uncased")
+    print(f"  GitHub: {repo}")
+    print(f"  Compatible: {is_compatible}")
+    if is_compatible:
+        print(f"  ✓ Licenses are {compatible_note}")
+    else:
+        print("  ✗ Licenses are NOT COMPATIBLE")
+    return True
+
 def test_license_check_endpoint():
     print("="*60)
     print("Testing License Compatibility Check Endpoint")
@@ -19,7 +52,7 @@ def test_license_check_endpoint():
         "url": "https://huggingface.co/google-bert/bert-base-uncased"
     }
     
-    response = requests.post(
+    response = SESSION.post(
         f"{BASE_URL}/artifact/model",
         headers=AUTH_HEADER,
         json=create_data
@@ -36,97 +69,30 @@ def test_license_check_endpoint():
         print(response.text)
         return
     
-    # Step 2: Check compatibility with MIT licensed repo
-    print(f"\n2. Checking compatibility with MIT licensed repo...")
-    license_check_data = {
-        "github_url": "https://github.com/huggingface/transformers"
-    }
-    
-    response = requests.post(
-        f"{BASE_URL}/artifact/model/{artifact_id}/license-check",
-        headers=AUTH_HEADER,
-        json=license_check_data
-    )
+    def check_license(github_url):
+        return SESSION.post(
+            f"{BASE_URL}/artifact/model/{artifact_id}/license-check",
+            headers=AUTH_HEADER,
+            json={"github_url": github_url}
+        )
     
-    if response.status_code == 200:
-        is_compatible = response.json()
-        print(f"✓ License check completed!")
-        print(f"  Artifact: google-bert/bert-base-uncased")
-        print(f"  GitHub: huggingface/transformers")
-        print(f"  Compatible: {is_compatible}")
-        if is_compatible:
-            print("  ✓ Licenses are COMPATIBLE for fine-tuning and inference")
-        else:
-            print("  ✗ Licenses are NOT COMPATIBLE")
-    else:
-        print(f"✗ Failed to check license: {response.status_code}")
-        print(response.text)
+    # Step 2: Check compatibility with MIT licensed repo
+    license_name, github_url = MIT_CHECK
+    if not report_license_check(2, license_name, github_url, check_license(github_url),
+                                compatible_note="COMPATIBLE for fine-tuning and inference"):
         return
     
-    # Step 3: Check with Apache 2.0 repo
-    print(f"\n3. Checking compatibility with Apache 2.0 licensed repo...")
-    license_check_data = {
-        "github_url": "https://github.com/google-research/bert"
-    }
-    
-    response = requests.post(
-        f"{BASE_URL}/artifact/model/{artifact_id}/license-check",
-        headers=AUTH_HEADER,
-        json=license_check_data
-    )
-    
-    if response.status_code == 200:
-        is_compatible = response.json()
-        print(f"✓ License check completed!")
-        print(f"  Artifact: google-bert/bert-base-uncased")
-        print(f"  GitHub: google-research/bert")
-        print(f"  Compatible: {is_compatible}")
-        if is_compatible:
-            print("  ✓ Licenses are COMPATIBLE")
-        else:
-            print("  ✗ Licenses are NOT COMPATIBLE")
-    else:
-        print(f"✗ Failed to check license: {response.status_code}")
-        print(response.text)
-    
-    # Step 4: Check with GPL repo (should be less compatible)
-    print(f"\n4. Checking compatibility with GPL licensed repo...")
-    license_check_data = {
-        "github_url": "https://github.com/pandas-dev/pandas"
-    }
-    
-    response = requests.post(
-        f"{BASE_URL}/artifact/model/{artifact_id}/license-check",
-        headers=AUTH_HEADER,
-        json=license_check_data
-    )
+    # Steps 3-5 check the same artifact against independent repos, so send
+    # those requests at once and report them in order
+    with ThreadPoolExecutor(max_workers=len(LICENSE_CHECKS) + 1) as executor:
+        responses = list(executor.map(check_license, [url for _, url in LICENSE_CHECKS] + [INVALID_REPO_URL]))
     
-    if response.status_code == 200:
-        is_compatible = response.json()
-        print(f"✓ License check completed!")
-        print(f"  Artifact: google-bert/bert-base-uncased")
-        print(f"  GitHub: pandas-dev/pandas")
-        print(f"  Compatible: {is_compatible}")
-        if is_compatible:
-            print("  ✓ Licenses are COMPATIBLE")
-        else:
-            print("  ✗ Licenses are NOT COMPATIBLE")
-    else:
-        print(f"✗ Failed to check license: {response.status_code}")
-        print(response.text)
+    for step, ((license_name, github_url), response) in enumerate(zip(LICENSE_CHECKS, responses), start=3):
+        report_license_check(step, license_name, github_url, response)
     
     # Step 5: Test error handling - invalid GitHub URL
     print(f"\n5. Testing error handling (invalid GitHub URL)...")
-    license_check_data = {
-        "github_url": "https://github.com/nonexistent/fakerepo12345"
-    }
-    
-    response = requests.post(
-        f"{BASE_URL}/artifact/model/{artifact_id}/license-check",
-        headers=AUTH_HEADER,
-        json=license_check_data
-    )
-    
+    response = responses[-1]
     if response.status_code == 404:
         print(f"✓ Correctly handled non-existent repo (404)")
     else:
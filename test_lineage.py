@@ -8,6 +8,9 @@ import json
 BASE_URL = "http://localhost:8080"
 AUTH_HEADER = {"X-Authorization": "test-token"}
 
+# Reuse one keep-alive connection instead of reconnecting for every call
+SESSION = requests.Session()
+
 def test_lineage_endpoint():
     print("="*60)
     print("Testing Lineage Extraction Endpoint")
@@ -20,7 +23,7 @@ def test_lineage_endpoint():
         "url": "https://huggingface.co/distilbert/distilbert-base-uncased"
     }
     
-    response = requests.post(
+    response = SESSION.post(
         f"{BASE_URL}/artifact/model",
         headers=AUTH_HEADER,
         json=create_data
@@ -39,7 +42,7 @@ def test_lineage_endpoint():
     
     # Step 2: Get lineage for the artifact
     print(f"\n2. Extracting lineage for artifact {artifact_id}...")
-    response = requests.get(
+    response = SESSION.get(
         f"{BASE_URL}/artifact/model/{artifact_id}/lineage",
         headers=AUTH_HEADER
     )
@@ -53,32 +56,33 @@ def test_lineage_endpoint():
         
         nodes = lineage.get('nodes', [])
         edges = lineage.get('edges', [])
+        # Resolve edge endpoints by lookup instead of scanning nodes per edge
+        name_by_id = {n.get('artifact_id'): n['name'] for n in nodes}
         
-        print(f"\nNodes ({len(nodes)}):")
+        # Build the whole report, then write it once
+        lines = [f"\nNodes ({len(nodes)}):"]
         for i, node in enumerate(nodes, 1):
-            print(f"\n  {i}. {node.get('name')}")
-            print(f"     ID: {node.get('artifact_id', 'N/A')}")
-            print(f"     Source: {node.get('source')}")
+            lines.append(f"\n  {i}. {node.get('name')}")
+            lines.append(f"     ID: {node.get('artifact_id', 'N/A')}")
+            lines.append(f"     Source: {node.get('source')}")
             metadata = node.get('metadata')
             if metadata:
-                print(f"     Metadata: {json.dumps(metadata, indent=10)}")
+                lines.append(f"     Metadata: {json.dumps(metadata, indent=10)}")
         
-        print(f"\nEdges ({len(edges)}):")
+        lines.append(f"\nEdges ({len(edges)}):")
         for i, edge in enumerate(edges, 1):
             from_id = edge.get('from_node_artifact_id')
             to_id = edge.get('to_node_artifact_id')
             relationship = edge.get('relationship')
             
-            # Find node names
-            from_name = next((n['name'] for n in nodes if n.get('artifact_id') == from_id), from_id)
-            to_name = next((n['name'] for n in nodes if n.get('artifact_id') == to_id), to_id)
-            
-            print(f"\n  {i}. {from_name}")
-            print(f"     --[{relationship}]-->")
-            print(f"     {to_name}")
+            lines.append(f"\n  {i}. {name_by_id.get(from_id, from_id)}")
+            lines.append(f"     --[{relationship}]-->")
+            lines.append(f"     {name_by_id.get(to_id, to_id)}")
         
         if len(edges) == 0:
-            print("  (No dependencies found)")
+            lines.append("  (No dependencies found)")
+        
+        print("\n".join(lines))
         
     else:
         print(f"✗ Failed to get lineage: {response.status_code}")
@@ -92,7 +96,7 @@ def test_lineage_endpoint():
         "url": "https://huggingface.co/google-bert/bert-base-uncased"
     }
     
-    response = requests.post(
+    response = SESSION.post(
         f"{BASE_URL}/artifact/model",
         headers=AUTH_HEADER,
         json=create_data
@@ -103,7 +107,7 @@ def test_lineage_endpoint():
         artifact_id = artifact['metadata']['id']
         print(f"✓ Base model artifact created: {artifact['metadata']['name']}")
         
-        response = requests.get(
+        response = SESSION.get(
             f"{BASE_URL}/artifact/model/{artifact_id}/lineage",
             headers=AUTH_HEADER
         )
@@ -9,6 +9,9 @@ import time
 BASE_URL = "http://localhost:8080"
 AUTH_HEADER = {"X-Authorization": "test-token"}
 
+# Reuse one keep-alive connection instead of reconnecting for every call
+SESSION = requests.Session()
+
 def test_rating_endpoint():
     print("="*60)
     print("Testing Phase 2 Rating Endpoint")
@@ -20,7 +23,7 @@ def test_rating_endpoint():
         "url": "https://huggingface.co/google-bert/bert-base-uncased"
     }
     
-    response = requests.post(
+    response = SESSION.post(
         f"{BASE_URL}/artifact/model",
         headers=AUTH_HEADER,
         json=create_data
@@ -43,7 +46,7 @@ def test_rating_endpoint():
     print("   (This may take 10-30 seconds as it calculates all metrics...)")
     
     start_time = time.time()
-    response = requests.get(
+    response = SESSION.get(
         f"{BASE_URL}/artifact/model/{artifact_id}/rate",
         headers=AUTH_HEADER
     )
@@ -52,28 +55,30 @@ def test_rating_endpoint():
     if response.status_code == 200:
         rating = response.json()
         print(f"✓ Rating calculated in {elapsed:.2f} seconds!")
-        print("\n" + "="*60)
-        print("RATING RESULTS:")
-        print("="*60)
-        print(f"Name:                    {rating['name']}")
-        print(f"Category:                {rating['category']}")
-        print(f"\nNet Score:               {rating['net_score']:.4f}")
-        print(f"Ramp-up Time:            {rating['ramp_up_time']:.4f}")
-        print(f"Bus Factor:              {rating['bus_factor']:.4f}")
-        print(f"Performance Claims:      {rating['performance_claims']:.4f}")
-        print(f"License:                 {rating['license']:.4f}")
-        print(f"Dataset & Code Score:    {rating['dataset_and_code_score']:.4f}")
-        print(f"Dataset Quality:         {rating['dataset_quality']:.4f}")
-        print(f"Code Quality:            {rating['code_quality']:.4f}")
-        print(f"Reproducibility:         {rating['reproducibility']:.4f}")
-        print(f"Reviewedness:            {rating['reviewedness']:.4f}")
-        print(f"Tree Score:              {rating['tree_score']:.4f}")
-        print(f"\nSize Scores:")
-        print(f"  Raspberry Pi:          {rating['size_score']['raspberry_pi']:.4f}")
-        print(f"  Jetson Nano:           {rating['size_score']['jetson_nano']:.4f}")
-        print(f"  Desktop PC:            {rating['size_score']['desktop_pc']:.4f}")
-        print(f"  AWS Server:            {rating['size_score']['aws_server']:.4f}")
-        print("="*60)
+        print("\n".join([
+            "\n" + "="*60,
+            "RATING RESULTS:",
+            "="*60,
+            f"Name:                    {rating['name']}",
+            f"Category:                {rating['category']}",
+            f"\nNet Score:               {rating['net_score']:.4f}",
+            f"Ramp-up Time:            {rating['ramp_up_time']:.4f}",
+            f"Bus Factor:              {rating['bus_factor']:.4f}",
+            f"Performance Claims:      {rating['performance_claims']:.4f}",
+            f"License:                 {rating['license']:.4f}",
+            f"Dataset & Code Score:    {rating['dataset_and_code_score']:.4f}",
+            f"Dataset Quality:         {rating['dataset_quality']:.4f}",
+            f"Code Quality:            {rating['code_quality']:.4f}",
+            f"Reproducibility:         {rating['reproducibility']:.4f}",
+            f"Reviewedness:            {rating['reviewedness']:.4f}",
+            f"Tree Score:              {rating['tree_score']:.4f}",
+            f"\nSize Scores:",
+            f"  Raspberry Pi:          {rating['size_score']['raspberry_pi']:.4f}",
+            f"  Jetson Nano:           {rating['size_score']['jetson_nano']:.4f}",
+            f"  Desktop PC:            {rating['size_score']['desktop_pc']:.4f}",
+            f"  AWS Server:            {rating['size_score']['aws_server']:.4f}",
+            "="*60,
+        ]))
     else:
         print(f"✗ Failed to rate artifact: {response.status_code}")
         print(response.text)
@@ -82,7 +87,7 @@ def test_rating_endpoint():
     # Step 3: Test cache (should be instant)
     print(f"\n3. Testing cached rating (should be instant)...")
     start_time = time.time()
-    response = requests.get(
+    response = SESSION.get(
         f"{BASE_URL}/artifact/model/{artifact_id}/rate",
         headers=AUTH_HEADER
     )
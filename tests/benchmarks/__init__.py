@@ -0,0 +1 @@
+# tests.benchmarks package init
@@ -0,0 +1,297 @@
+# tests/conftest.py
+"""
+Shared pytest fixtures
+"""
+
+import json
+import os
+import re
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from types import MappingProxyType
+from unittest.mock import MagicMock, patch
+
+import pytest
+import requests
+from src.metrics.busfactor_metric import BusFactorMetric
+from src.metrics.calculator import MetricsCalculator
+from src.metrics.code_quality_metric import CodeQualityMetric
+from src.metrics.dataset_code_metric import DatasetCodeMetric
+from src.metrics.dataset_quality_metric import DatasetQualityMetric
+from src.metrics.license_metric import LicenseMetric
+from src.metrics.performance_metric import PerformanceMetric
+from src.metrics.rampup_metric import RampUpMetric
+from src.metrics.size_metric import SizeMetric
+from src.models.model import ModelInfo
+from src.utils.disk_cache import DiskCache
+from src.utils.endpoints import HF_MODEL_TREE_API, HF_README
+from src.utils.http_cache import api_cache
+from src.utils.readme_cache import readme_cache
+
+
+@pytest.fixture(autouse=True)
+def clear_http_caches():
+    """Isolate tests from responses cached by earlier tests"""
+    readme_cache.clear()
+    api_cache.clear()
+    yield
+    readme_cache.clear()
+    api_cache.clear()
+
+
+# The moment tests treat as "now", so ages computed from timestamps don't
+# drift with the calendar
+FROZEN_NOW = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+class _FrozenDatetime(datetime):
+    @classmethod
+    def now(cls, tz=None):
+        return FROZEN_NOW.astimezone(tz) if tz is not None else FROZEN_NOW.replace(tzinfo=None)
+
+
+@pytest.fixture
+def frozen_now(monkeypatch):
+    """Pin datetime.now() in the bus factor metric to FROZEN_NOW"""
+    monkeypatch.setattr('src.metrics.busfactor_metric.datetime', _FrozenDatetime)
+    return FROZEN_NOW
+
+
+# Responses fetched by integration tests, kept between runs (and restored by CI)
+INTEGRATION_CACHE_DIR = os.path.join(os.path.dirname(__file__), '.http_cache')
+
+
+@contextmanager
+def _integration_http():
+    """Back the HTTP caches with INTEGRATION_CACHE_DIR while the block runs
+    
+    On a warm cache each README and API response is revalidated with a
+    conditional GET, so unchanged ones come back as a bodiless 304 rather
+    than being downloaded again. With HF_HUB_OFFLINE=1 those revalidations
+    are answered 304 locally, so only never-seen URLs reach the network.
+    """
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        disk = DiskCache(INTEGRATION_CACHE_DIR)
+        monkeypatch.setattr(readme_cache, 'disk', disk)
+        monkeypatch.setattr(api_cache, 'disk', disk)
+        
+        if os.environ.get('HF_HUB_OFFLINE') == '1':
+            online_get = requests.Session.get
+            
+            def get(session, url, headers=None, **kwargs):
+                # The caches only send validators for responses they have stored
+                if headers and ('If-None-Match' in headers or 'If-Modified-Since' in headers):
+                    return _response(304)
+                return online_get(session, url, headers=headers, **kwargs)
+            
+            monkeypatch.setattr(requests.Session, 'get', get)
+        yield
+
+
+@pytest.fixture(autouse=True)
+def integration_disk_cache(request):
+    """Run integration-marked tests with the persistent HTTP cache"""
+    if request.node.get_closest_marker('integration') is None:
+        yield
+        return
+    with _integration_http():
+        yield
+
+
+@pytest.fixture(autouse=True)
+def block_network(request, monkeypatch):
+    """Fail any real HTTP request made outside integration-marked tests
+    
+    Requests are refused at the transport adapter, so hf_api and other
+    patches of Session.get still answer. Anything that slips past them
+    gets an immediate ConnectionError instead of a DNS timeout.
+    """
+    if request.node.get_closest_marker('integration') is not None:
+        return
+    
+    def send(adapter, prepared_request, **kwargs):
+        raise requests.ConnectionError(f"Network access is disabled outside integration tests: {prepared_request.url}")
+    
+    monkeypatch.setattr(requests.adapters.HTTPAdapter, 'send', send)
+
+
+@pytest.fixture(scope="session")
+def integration_http():
+    """The persistent-cache context, for wider-scoped fixtures that call real APIs"""
+    return _integration_http
+
+
+def pytest_collection_modifyitems(config, items):
+    """Run offline tests (see block_network) before the ones that call real APIs
+    
+    The sort is stable, so pytest-randomly's shuffle (applied first) still
+    decides the order within each group, and -x stops on a unit failure
+    before any network test starts.
+    """
+    items.sort(key=lambda item: item.get_closest_marker('integration') is not None)
+
+
+@pytest.fixture(scope="session")
+def model_info_factory():
+    """Build a ModelInfo from a name plus only the fields a test cares about
+    
+    The URL is derived from the name and every other field defaults to the
+    empty values most tests spell out by hand. Each call returns a new
+    instance, since metrics and __post_init__ mutate it.
+    """
+    def make(name="test/model", **overrides):
+        fields = dict(
+            url=f"https://huggingface.co/{name}",
+            api_data={},
+            model_index=None,
+            tags=None,
+            likes=0,
+            downloads=0,
+            last_modified=None
+        )
+        fields.update(overrides)
+        return ModelInfo(name=name, **fields)
+    
+    return make
+
+
+class FakeHub:
+    """Canned Hugging Face responses routed by URL, standing in for the network
+    
+    Routes are regex patterns searched against the requested URL; the most
+    recently registered match wins, so a test overrides a default by
+    registering its own. Unmatched URLs answer 404.
+    """
+    
+    def __init__(self):
+        self.routes = []
+        self.requested = []
+    
+    def register(self, pattern, text=None, json_body=None, status_code=200):
+        self.routes.insert(0, (re.compile(pattern), status_code, text, json_body))
+    
+    def readme(self, text):
+        """Serve text as every model's README"""
+        self.register(_url_pattern(HF_README), text=text)
+    
+    def tree(self, files):
+        """Serve a listing of the given paths as every model's file tree"""
+        self.register(_url_pattern(HF_MODEL_TREE_API), json_body=[{'path': path} for path in files])
+    
+    def get(self, url, **kwargs):
+        self.requested.append(url)
+        for pattern, status_code, text, json_body in self.routes:
+            if pattern.search(url):
+                return _response(status_code, text, json_body)
+        return _response(404)
+
+
+def _url_pattern(template):
+    return re.escape(template).replace(re.escape('{name}'), '.+')
+
+
+def _response(status_code, text=None, json_body=None):
+    response = requests.Response()
+    response.status_code = status_code
+    response.encoding = 'utf-8'
+    response._content = (json.dumps(json_body) if json_body is not None else text or '').encode()
+    return response
+
+
+@pytest.fixture
+def hf_api():
+    """Route every requests.Session.get to a FakeHub
+    
+    Models have no README and an empty file tree until a test registers
+    its own with hf_api.readme() / hf_api.tree() / hf_api.register().
+    """
+    hub = FakeHub()
+    hub.register(_url_pattern(HF_README), status_code=404)
+    hub.tree([])
+    with patch.object(requests.Session, 'get', lambda session, url, **kwargs: hub.get(url, **kwargs)):
+        yield hub
+
+
+# Metrics keep no per-model state, so one instance of each serves the whole
+# session; tests that patch a method use patch.object, which restores it
+
+@pytest.fixture(scope="session")
+def license_metric():
+    return LicenseMetric()
+
+
+@pytest.fixture(scope="session")
+def size_metric():
+    return SizeMetric()
+
+
+@pytest.fixture(scope="session")
+def busfactor_metric():
+    return BusFactorMetric()
+
+
+@pytest.fixture(scope="session")
+def performance_metric():
+    return PerformanceMetric()
+
+
+@pytest.fixture(scope="session")
+def dataset_code_metric():
+    return DatasetCodeMetric()
+
+
+@pytest.fixture(scope="session")
+def dataset_quality_metric():
+    return DatasetQualityMetric()
+
+
+@pytest.fixture(scope="session")
+def code_quality_metric():
+    return CodeQualityMetric()
+
+
+@pytest.fixture(scope="session")
+def rampup_metric():
+    return RampUpMetric()
+
+
+@pytest.fixture(scope="session")
+def metrics_calculator():
+    return MetricsCalculator()
+
+
+# Per-hardware scores standing in for the size metric; read-only because
+# session-scoped fixtures hand the same object to every test
+MOCK_SIZE_SCORES = MappingProxyType({'raspberry_pi': 0.5, 'jetson_nano': 0.8, 'desktop_pc': 1.0, 'aws_server': 1.0})
+
+# Fixed scores for tests that exercise the calculator rather than the metrics
+# (the size dict is a plain copy so results stay JSON-serializable)
+MOCK_METRIC_SCORES = {
+    'license_metric': 0.9,
+    'size_metric': dict(MOCK_SIZE_SCORES),
+    'rampup_metric': 0.7,
+    'busfactor_metric': 0.6,
+    'performance_metric': 0.5,
+    'dataset_code_metric': 0.4,
+    'dataset_quality_metric': 0.3,
+    'code_quality_metric': 0.8
+}
+
+
+@pytest.fixture(scope="session")
+def mock_size_scores():
+    """The read-only MOCK_SIZE_SCORES mapping"""
+    return MOCK_SIZE_SCORES
+
+
+@pytest.fixture
+def mocked_calculator(hf_api):
+    """A fresh MetricsCalculator whose metrics return MOCK_METRIC_SCORES
+    
+    The calculator's README/file-tree prefetches are answered by hf_api,
+    so nothing reaches the network.
+    """
+    calculator = MetricsCalculator()
+    for attr, score in MOCK_METRIC_SCORES.items():
+        getattr(calculator, attr).calculate = MagicMock(return_value=score)
+    return calculator
@@ -0,0 +1,69 @@
+# tests/samples.py
+"""
+Canned model cards and sources shared by the metric tests
+"""
+
+# Canned model cards, served through hf_api.readme()
+READMES = {
+    'apache_license': """
+# Model Name
+
+## License
+This model is licensed under the Apache License 2.0
+""",
+    'benchmarks': """
+# Model Performance
+
+## Benchmarks
+- GLUE: 85.2%
+- SuperGLUE: 78.5%
+- BLEU: 45.6
+- ROUGE: 52.3
+""",
+    'dataset_and_code': """
+# Model Documentation
+
+## Dataset
+This model was trained on a large dataset of 1M samples.
+The training data was collected from various sources.
+
+## Code Example
+```python
+from transformers import AutoModel
+model = AutoModel.from_pretrained('test/model')
+```
+""",
+    'dataset_quality': """
+# Model Documentation
+
+## Dataset Quality
+The model was trained on high-quality, curated data.
+Data preprocessing included cleaning, filtering, and deduplication.
+The dataset contains 1M samples with quality control measures.
+""",
+    'usage': """
+# Model Usage
+
+## Quick Start
+```python
+from transformers import AutoModel
+model = AutoModel.from_pretrained('test/model')
+```
+
+## Examples
+See the examples/ directory for usage examples.
+"""
+}
+
+# A repo listing with Python sources, served through hf_api.tree()
+CODE_FILES = ('requirements.txt', 'config.json', 'train.py', 'inference.py', 'README.md')
+
+# A documented Python file for the code quality analysis
+TRAIN_PY = '''
+def train_model():
+    """
+    Train the model with proper documentation.
+    """
+    # This is a well-documented function
+    pass
+'''
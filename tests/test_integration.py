@@ -4,7 +4,6 @@ Integration tests
 """
 
 import pytest
-import json
 import tempfile
 import os
 import sys
@@ -12,6 +11,7 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
 from Software.main import MLEvaluator
 
+@pytest.mark.integration
 class TestIntegration:
     
     def test_full_pipeline_mock_model(self):
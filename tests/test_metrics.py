@@ -55,6 +55,7 @@ class TestMetrics:
         for score in scores.values():
             assert 0.0 <= score <= 1.0
     
+    @pytest.mark.integration
     def test_metrics_calculator_structure(self):
         """Test metrics calculator returns proper structure"""
         model_info = ModelInfo(
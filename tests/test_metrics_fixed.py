@@ -4,11 +4,8 @@ Fixed comprehensive tests for all metrics to achieve 80%+ coverage
 """
 
 import pytest
-import json
-import tempfile
-import os
-from unittest.mock import Mock, patch, MagicMock
-from src.models.model import ModelInfo, DatasetInfo, CodeInfo, MetricResult
+from types import SimpleNamespace
+from unittest.mock import patch
 from src.metrics.license_metric import LicenseMetric
 from src.metrics.size_metric import SizeMetric
 from src.metrics.busfactor_metric import BusFactorMetric
@@ -17,7 +14,15 @@ from src.metrics.dataset_code_metric import DatasetCodeMetric
 from src.metrics.dataset_quality_metric import DatasetQualityMetric
 from src.metrics.code_quality_metric import CodeQualityMetric
 from src.metrics.rampup_metric import RampUpMetric
-from src.metrics.calculator import MetricsCalculator
+from tests.samples import CODE_FILES, READMES, TRAIN_PY
+
+
+LATENCY_KEYS = frozenset([
+    'net_score_latency', 'ramp_up_time_latency', 'bus_factor_latency',
+    'performance_claims_latency', 'license_latency', 'size_score_latency',
+    'dataset_and_code_score_latency', 'dataset_quality_latency', 'code_quality_latency'
+])
+STRING_KEYS = frozenset(['name', 'category'])
 
 
 class TestLicenseMetric:
@@ -30,111 +35,36 @@ class TestLicenseMetric:
         assert hasattr(metric, 'license_scores')
         assert 'apache-2.0' in metric.license_scores
     
-    def test_license_calculation_apache(self):
-        """Test license calculation for Apache license"""
-        metric = LicenseMetric()
-        model_info = ModelInfo(
-            name="test/model",
-            url="https://huggingface.co/test/model",
-            api_data={'license': 'apache-2.0'},
-            model_index=None,
-            tags=None,
-            likes=0,
-            downloads=0,
-            last_modified=None
-        )
-    
-        result = metric.calculate(model_info)
-        assert result == 1.0
-
-    def test_license_calculation_mit(self):
-        """Test license calculation for MIT license"""
-        metric = LicenseMetric()
-        model_info = ModelInfo(
-            name="test/model",
-            url="https://huggingface.co/test/model",
-            api_data={'license': 'mit'},
-            model_index=None,
-            tags=None,
-            likes=0,
-            downloads=0,
-            last_modified=None
-        )
+    @pytest.mark.parametrize("license_str, expected", [
+        ('apache-2.0', 1.0),
+        ('mit', 1.0),
+        ('gpl-3.0', 0.3),
+        ('unknown', 0.1),
+    ], ids=['apache', 'mit', 'gpl', 'unknown'])
+    def test_license_calculation(self, license_str, expected, license_metric, model_info_factory):
+        """Test license calculation for each license in the API data"""
+        model_info = model_info_factory(api_data={'license': license_str})
         
-        result = metric.calculate(model_info)
-        assert result == 1.0
+        result = license_metric.calculate(model_info)
+        assert result == pytest.approx(expected)
     
-    def test_license_calculation_gpl(self):
-        """Test license calculation for GPL license"""
-        metric = LicenseMetric()
-        model_info = ModelInfo(
-            name="test/model",
-            url="https://huggingface.co/test/model",
-            api_data={'license': 'gpl-3.0'},
-            model_index=None,
-            tags=None,
-            likes=0,
-            downloads=0,
-            last_modified=None
-        )
-        
-        result = metric.calculate(model_info)
-        assert result == 0.3
-    
-    def test_license_calculation_unknown(self):
-        """Test license calculation for unknown license"""
-        metric = LicenseMetric()
-        model_info = ModelInfo(
-            name="test/model",
-            url="https://huggingface.co/test/model",
-            api_data={'license': 'unknown'},
-            model_index=None,
-            tags=None,
-            likes=0,
-            downloads=0,
-            last_modified=None
-        )
-        
-        result = metric.calculate(model_info)
-        assert result == 0.1
-    
-    @patch('src.metrics.license_metric.requests.Session.get')
-    def test_license_parsing_from_readme(self, mock_get):
+    def test_license_parsing_from_readme(self, hf_api, license_metric, model_info_factory):
         """Test license parsing from README"""
-        metric = LicenseMetric()
         
         # Mock README response
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.text = """
-        # Model Name
-        
-        ## License
-        This model is licensed under the Apache License 2.0
-        """
-        mock_get.return_value = mock_response
-        
-        model_info = ModelInfo(
-            name="test/model",
-            url="https://huggingface.co/test/model",
-            api_data={},
-            model_index=None,
-            tags=None,
-            likes=0,
-            downloads=0,
-            last_modified=None
-        )
+        hf_api.readme(READMES['apache_license'])
         
-        result = metric.calculate(model_info)
-        assert result == 0.9
+        model_info = model_info_factory()
+        
+        result = license_metric.calculate(model_info)
+        assert result == pytest.approx(0.9)
     
-    def test_license_calculation_exception(self):
+    def test_license_calculation_exception(self, license_metric):
         """Test license calculation with exception"""
-        metric = LicenseMetric()
         model_info = None  # This will cause an exception
         
-        result = metric.calculate(model_info)
-        assert result == 0.1
+        result = license_metric.calculate(model_info)
+        assert result == pytest.approx(0.1)
 
 
 class TestSizeMetric:
@@ -147,80 +77,42 @@ class TestSizeMetric:
         assert hasattr(metric, 'hardware_limits')
         assert 'raspberry_pi' in metric.hardware_limits
     
-    def test_size_calculation_small_model(self):
-        """Test size calculation for small model"""
-        metric = SizeMetric()
-        model_info = ModelInfo(
-            name="test/small-model",
-            url="https://huggingface.co/test/small-model",
-            api_data={},
-            model_index=None,
-            tags=None,
-            likes=0,
-            downloads=0,
-            last_modified=None
-        )
-        
-        with patch.object(metric, '_estimate_model_size', return_value=0.5):
-            result = metric.calculate(model_info)
-            assert isinstance(result, dict)
-            assert 'raspberry_pi' in result
-            assert 'jetson_nano' in result
-            assert 'desktop_pc' in result
-            assert 'aws_server' in result
-    
-    def test_size_calculation_large_model(self):
-        """Test size calculation for large model"""
-        metric = SizeMetric()
-        model_info = ModelInfo(
-            name="test/7b-model",
-            url="https://huggingface.co/test/7b-model",
-            api_data={},
-            model_index=None,
-            tags=None,
-            likes=0,
-            downloads=0,
-            last_modified=None
-        )
-        
-        with patch.object(metric, '_estimate_model_size', return_value=13.0):
-            result = metric.calculate(model_info)
+    @pytest.mark.parametrize("name, estimated_size, expected_pi, expected_aws", [
+        ("test/small-model", 0.5, 1.0, 1.0),
+        # Too large for Raspberry Pi, fits on AWS server
+        ("test/7b-model", 13.0, 0.0, 1.0),
+    ], ids=['small_model', 'large_model'])
+    def test_size_calculation(self, name, estimated_size, expected_pi, expected_aws, size_metric, model_info_factory):
+        """Test size calculation for a given estimated model size"""
+        model_info = model_info_factory(name=name)
+        
+        with patch.object(size_metric, '_estimate_model_size', return_value=estimated_size):
+            result = size_metric.calculate(model_info)
             assert isinstance(result, dict)
-            assert result['raspberry_pi'] == 0.0  # Too large for Raspberry Pi
-            assert result['aws_server'] == 1.0    # Fits on AWS server
+            assert set(result) == {'raspberry_pi', 'jetson_nano', 'desktop_pc', 'aws_server'}
+            assert result['raspberry_pi'] == pytest.approx(expected_pi)
+            assert result['aws_server'] == pytest.approx(expected_aws)
     
-    def test_size_estimation_from_name(self):
+    def test_size_estimation_from_name(self, hf_api, size_metric, model_info_factory):
         """Test size estimation from model name"""
-        metric = SizeMetric()
-        model_info = ModelInfo(
-            name="test/7b-model",
-            url="https://huggingface.co/test/7b-model",
-            api_data={},
-            model_index=None,
-            tags=None,
-            likes=0,
-            downloads=0,
-            last_modified=None
+        model_info = model_info_factory(name="test/7b-model")
+        
+        # Empty file tree, so the size comes from the name
+        size = size_metric._estimate_model_size(model_info)
+        assert size == 13.0  # 7B model estimated size
+    
+    def test_size_estimation_from_api_siblings(self, hf_api, size_metric, model_info_factory):
+        """Test file sizes in the API data are used without a tree request"""
+        model_info = model_info_factory(
+            api_data={'siblings': [
+                {'rfilename': 'model.safetensors', 'size': 2 * 1024 ** 3},
+                {'rfilename': 'config.json', 'size': 1024 ** 3}
+            ]}
         )
         
-        with patch('src.metrics.size_metric.requests.Session.get') as mock_get:
-            mock_response = Mock()
-            mock_response.status_code = 200
-            mock_response.json.return_value = []
-            mock_get.return_value = mock_response
-            
-            size = metric._estimate_model_size(model_info)
-            assert size == 13.0  # 7B model estimated size
-    
-    def test_size_calculation_exception(self):
-        """Test size calculation with exception"""
-        metric = SizeMetric()
-        model_info = None  # This will cause an exception
-        
-        result = metric.calculate(model_info)
-        assert isinstance(result, dict)
-        # The actual implementation returns default values, not all 0.5
-        assert all(0.0 <= score <= 1.0 for score in result.values())
+        size = size_metric._estimate_model_size(model_info)
+        assert size == 3.0
+        assert hf_api.requested == []
 
 
 class TestBusFactorMetric:
@@ -231,81 +123,23 @@ class TestBusFactorMetric:
         metric = BusFactorMetric()
         assert metric is not None
     
-    def test_bus_factor_calculation_recent_activity(self):
-        """Test bus factor calculation with recent activity"""
-        metric = BusFactorMetric()
-        model_info = ModelInfo(
-            name="google/test-model",
-            url="https://huggingface.co/google/test-model",
-            api_data={},
-            model_index=None,
-            tags=None,
-            likes=1000,
-            downloads=50000,
-            last_modified="2024-01-01T00:00:00Z"
+    @pytest.mark.parametrize("name, likes, downloads, last_modified", [
+        ("google/test-model", 1000, 50000, "2024-01-01T00:00:00Z"),
+        ("test/old-model", 10, 100, "2020-01-01T00:00:00Z"),
+        ("google/test-model", 100, 1000, "2024-01-01T00:00:00Z"),
+        ("test/popular-model", 5000, 200000, "2024-01-01T00:00:00Z"),
+    ], ids=['recent_activity', 'old_activity', 'known_organization', 'community_engagement'])
+    def test_bus_factor_calculation(self, name, likes, downloads, last_modified, busfactor_metric, model_info_factory):
+        """Test bus factor calculation for a given activity profile"""
+        model_info = model_info_factory(
+            name=name,
+            likes=likes,
+            downloads=downloads,
+            last_modified=last_modified
         )
         
-        result = metric.calculate(model_info)
+        result = busfactor_metric.calculate(model_info)
         assert 0.0 <= result <= 1.0
-    
-    def test_bus_factor_calculation_old_activity(self):
-        """Test bus factor calculation with old activity"""
-        metric = BusFactorMetric()
-        model_info = ModelInfo(
-            name="test/old-model",
-            url="https://huggingface.co/test/old-model",
-            api_data={},
-            model_index=None,
-            tags=None,
-            likes=10,
-            downloads=100,
-            last_modified="2020-01-01T00:00:00Z"
-        )
-        
-        result = metric.calculate(model_info)
-        assert 0.0 <= result <= 1.0
-    
-    def test_bus_factor_known_organization(self):
-        """Test bus factor for known organization"""
-        metric = BusFactorMetric()
-        model_info = ModelInfo(
-            name="google/test-model",
-            url="https://huggingface.co/google/test-model",
-            api_data={},
-            model_index=None,
-            tags=None,
-            likes=100,
-            downloads=1000,
-            last_modified="2024-01-01T00:00:00Z"
-        )
-        
-        result = metric.calculate(model_info)
-        assert 0.0 <= result <= 1.0
-    
-    def test_bus_factor_community_engagement(self):
-        """Test bus factor community engagement"""
-        metric = BusFactorMetric()
-        model_info = ModelInfo(
-            name="test/popular-model",
-            url="https://huggingface.co/test/popular-model",
-            api_data={},
-            model_index=None,
-            tags=None,
-            likes=5000,
-            downloads=200000,
-            last_modified="2024-01-01T00:00:00Z"
-        )
-        
-        result = metric.calculate(model_info)
-        assert 0.0 <= result <= 1.0
-    
-    def test_bus_factor_calculation_exception(self):
-        """Test bus factor calculation with exception"""
-        metric = BusFactorMetric()
-        model_info = None  # This will cause an exception
-        
-        result = metric.calculate(model_info)
-        assert 0.0 <= result <= 1.0  # Should return a valid score
 
 
 class TestPerformanceMetric:
@@ -316,84 +150,37 @@ class TestPerformanceMetric:
         metric = PerformanceMetric()
         assert metric is not None
     
-    def test_performance_calculation_with_model_index(self):
+    def test_performance_calculation_with_model_index(self, hf_api, performance_metric, model_info_factory):
         """Test performance calculation with model index"""
-        metric = PerformanceMetric()
-        model_info = ModelInfo(
-            name="test/model",
-            url="https://huggingface.co/test/model",
-            api_data={},
+        model_info = model_info_factory(
             model_index=[{
                 'results': [{
                     'metrics': ['accuracy', 'bleu', 'rouge']
                 }]
             }],
-            tags=['evaluation', 'benchmark'],
-            likes=0,
-            downloads=0,
-            last_modified=None
+            tags=['evaluation', 'benchmark']
         )
         
-        result = metric.calculate(model_info)
+        result = performance_metric.calculate(model_info)
         assert 0.0 <= result <= 1.0
     
-    @patch('src.metrics.performance_metric.requests.Session.get')
-    def test_performance_calculation_with_readme(self, mock_get):
+    def test_performance_calculation_with_readme(self, hf_api, performance_metric, model_info_factory):
         """Test performance calculation with README benchmarks"""
-        metric = PerformanceMetric()
         
         # Mock README response
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.text = """
-        # Model Performance
-        
-        ## Benchmarks
-        - GLUE: 85.2%
-        - SuperGLUE: 78.5%
-        - BLEU: 45.6
-        - ROUGE: 52.3
-        """
-        mock_get.return_value = mock_response
-        
-        model_info = ModelInfo(
-            name="test/model",
-            url="https://huggingface.co/test/model",
-            api_data={},
-            model_index=None,
-            tags=None,
-            likes=0,
-            downloads=0,
-            last_modified=None
-        )
+        hf_api.readme(READMES['benchmarks'])
         
-        result = metric.calculate(model_info)
+        model_info = model_info_factory()
+        
+        result = performance_metric.calculate(model_info)
         assert 0.0 <= result <= 1.0
     
-    def test_performance_calculation_with_tags(self):
+    def test_performance_calculation_with_tags(self, hf_api, performance_metric, model_info_factory):
         """Test performance calculation with evaluation tags"""
-        metric = PerformanceMetric()
-        model_info = ModelInfo(
-            name="test/model",
-            url="https://huggingface.co/test/model",
-            api_data={},
-            model_index=None,
-            tags=['evaluation', 'benchmark', 'performance'],
-            likes=0,
-            downloads=0,
-            last_modified=None
-        )
+        model_info = model_info_factory(tags=['evaluation', 'benchmark', 'performance'])
         
-        result = metric.calculate(model_info)
+        result = performance_metric.calculate(model_info)
         assert 0.0 <= result <= 1.0
-    
-    def test_performance_calculation_exception(self):
-        """Test performance calculation with exception"""
-        metric = PerformanceMetric()
-        model_info = None  # This will cause an exception
-        
-        result = metric.calculate(model_info)
-        assert 0.0 <= result <= 1.0  # Should return a valid score
 
 
 class TestDatasetCodeMetric:
@@ -404,69 +191,27 @@ class TestDatasetCodeMetric:
         metric = DatasetCodeMetric()
         assert metric is not None
     
-    def test_dataset_code_calculation_with_model_index(self):
+    def test_dataset_code_calculation_with_model_index(self, hf_api, dataset_code_metric, model_info_factory):
         """Test dataset code calculation with model index"""
-        metric = DatasetCodeMetric()
-        model_info = ModelInfo(
-            name="test/model",
-            url="https://huggingface.co/test/model",
-            api_data={},
+        model_info = model_info_factory(
             model_index=[{
                 'datasets': ['dataset1', 'dataset2']
-            }],
-            tags=None,
-            likes=0,
-            downloads=0,
-            last_modified=None
+            }]
         )
         
-        result = metric.calculate(model_info)
+        result = dataset_code_metric.calculate(model_info)
         assert 0.0 <= result <= 1.0
     
-    @patch('src.metrics.dataset_code_metric.requests.Session.get')
-    def test_dataset_code_calculation_with_readme(self, mock_get):
+    def test_dataset_code_calculation_with_readme(self, hf_api, dataset_code_metric, model_info_factory):
         """Test dataset code calculation with README"""
-        metric = DatasetCodeMetric()
         
-        # Mock responses
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.text = """
-        # Model Documentation
-        
-        ## Dataset
-        This model was trained on a large dataset of 1M samples.
-        The training data was collected from various sources.
-        
-        ## Code Example
-        ```python
-        from transformers import AutoModel
-        model = AutoModel.from_pretrained('test/model')
-        ```
-        """
-        mock_get.return_value = mock_response
-        
-        model_info = ModelInfo(
-            name="test/model",
-            url="https://huggingface.co/test/model",
-            api_data={},
-            model_index=None,
-            tags=None,
-            likes=0,
-            downloads=0,
-            last_modified=None
-        )
+        # Mock README response
+        hf_api.readme(READMES['dataset_and_code'])
         
-        result = metric.calculate(model_info)
-        assert 0.0 <= result <= 1.0
-    
-    def test_dataset_code_calculation_exception(self):
-        """Test dataset code calculation with exception"""
-        metric = DatasetCodeMetric()
-        model_info = None  # This will cause an exception
+        model_info = model_info_factory()
         
-        result = metric.calculate(model_info)
-        assert 0.0 <= result <= 1.0  # Should return a valid score
+        result = dataset_code_metric.calculate(model_info)
+        assert 0.0 <= result <= 1.0
 
 
 class TestDatasetQualityMetric:
@@ -477,45 +222,16 @@ class TestDatasetQualityMetric:
         metric = DatasetQualityMetric()
         assert metric is not None
     
-    @patch('src.metrics.dataset_quality_metric.requests.Session.get')
-    def test_dataset_quality_calculation_with_readme(self, mock_get):
+    def test_dataset_quality_calculation_with_readme(self, hf_api, dataset_quality_metric, model_info_factory):
         """Test dataset quality calculation with README"""
-        metric = DatasetQualityMetric()
         
         # Mock README response
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.text = """
-        # Model Documentation
-        
-        ## Dataset Quality
-        The model was trained on high-quality, curated data.
-        Data preprocessing included cleaning, filtering, and deduplication.
-        The dataset contains 1M samples with quality control measures.
-        """
-        mock_get.return_value = mock_response
-        
-        model_info = ModelInfo(
-            name="test/model",
-            url="https://huggingface.co/test/model",
-            api_data={},
-            model_index=None,
-            tags=None,
-            likes=0,
-            downloads=0,
-            last_modified=None
-        )
+        hf_api.readme(READMES['dataset_quality'])
         
-        result = metric.calculate(model_info)
-        assert 0.0 <= result <= 1.0
-    
-    def test_dataset_quality_calculation_exception(self):
-        """Test dataset quality calculation with exception"""
-        metric = DatasetQualityMetric()
-        model_info = None  # This will cause an exception
+        model_info = model_info_factory()
         
-        result = metric.calculate(model_info)
-        assert 0.0 <= result <= 1.0  # Should return a valid score
+        result = dataset_quality_metric.calculate(model_info)
+        assert 0.0 <= result <= 1.0
 
 
 class TestCodeQualityMetric:
@@ -526,57 +242,17 @@ class TestCodeQualityMetric:
         metric = CodeQualityMetric()
         assert metric is not None
     
-    @patch('src.metrics.code_quality_metric.requests.Session.get')
-    def test_code_quality_calculation_with_files(self, mock_get):
+    def test_code_quality_calculation_with_files(self, hf_api, code_quality_metric, model_info_factory):
         """Test code quality calculation with files"""
-        metric = CodeQualityMetric()
         
-        # Mock file listing response
-        files_response = Mock()
-        files_response.status_code = 200
-        files_response.json.return_value = [
-            {'path': 'requirements.txt'},
-            {'path': 'config.json'},
-            {'path': 'train.py'},
-            {'path': 'inference.py'},
-            {'path': 'README.md'}
-        ]
-        
-        # Mock file content response
-        file_response = Mock()
-        file_response.status_code = 200
-        file_response.text = '''
-        def train_model():
-            """
-            Train the model with proper documentation.
-            """
-            # This is a well-documented function
-            pass
-        '''
-        
-        mock_get.side_effect = [files_response, file_response]
-        
-        model_info = ModelInfo(
-            name="test/model",
-            url="https://huggingface.co/test/model",
-            api_data={},
-            model_index=None,
-            tags=None,
-            likes=0,
-            downloads=0,
-            last_modified=None
-        )
+        # File listing plus the source of each Python file
+        hf_api.tree(CODE_FILES)
+        hf_api.register(r'/raw/main/.+\.py$', text=TRAIN_PY)
         
-        result = metric.calculate(model_info)
-        assert 0.0 <= result <= 1.0
-    
-    def test_code_quality_calculation_exception(self):
-        """Test code quality calculation with exception"""
-        metric = CodeQualityMetric()
-        model_info = None  # This will cause an exception
+        model_info = model_info_factory()
         
-        result = metric.calculate(model_info)
-        assert 0.0 <= result <= 1.0  # Should return a valid score
+        result = code_quality_metric.calculate(model_info)
+        assert 0.0 <= result <= 1.0
 
 
 class TestRampUpMetric:
@@ -587,210 +263,179 @@ class TestRampUpMetric:
         metric = RampUpMetric()
         assert metric is not None
     
-    @patch('src.metrics.rampup_metric.requests.Session.get')
-    def test_rampup_calculation_with_readme(self, mock_get):
+    def test_rampup_calculation_with_readme(self, hf_api, rampup_metric, model_info_factory):
         """Test ramp-up calculation with README"""
-        metric = RampUpMetric()
         
         # Mock README response
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.text = """
-        # Model Usage
-        
-        ## Quick Start
-        ```python
-        from transformers import AutoModel
-        model = AutoModel.from_pretrained('test/model')
-        ```
-        
-        ## Examples
-        See the examples/ directory for usage examples.
-        """
-        mock_get.return_value = mock_response
-        
-        model_info = ModelInfo(
-            name="test/model",
-            url="https://huggingface.co/test/model",
-            api_data={},
-            model_index=None,
-            tags=None,
-            likes=100,
-            downloads=1000,
-            last_modified=None
-        )
+        hf_api.readme(READMES['usage'])
         
-        result = metric.calculate(model_info)
+        model_info = model_info_factory(likes=100, downloads=1000)
+        
+        result = rampup_metric.calculate(model_info)
         assert 0.0 <= result <= 1.0
-    
-    def test_rampup_calculation_exception(self):
-        """Test ramp-up calculation with exception"""
-        metric = RampUpMetric()
+
+
+class TestMetricExceptions:
+    """Test every metric falls back to valid scores on bad input"""
+    
+    @pytest.mark.parametrize("metric_fixture, returns_dict", [
+        ('size_metric', True),
+        ('busfactor_metric', False),
+        ('performance_metric', False),
+        ('dataset_code_metric', False),
+        ('dataset_quality_metric', False),
+        ('code_quality_metric', False),
+        ('rampup_metric', False),
+    ], ids=['size', 'bus_factor', 'performance', 'dataset_code', 'dataset_quality', 'code_quality', 'rampup'])
+    def test_calculation_exception(self, metric_fixture, returns_dict, request):
+        """Test calculation with exception"""
+        metric = request.getfixturevalue(metric_fixture)
         model_info = None  # This will cause an exception
         
         result = metric.calculate(model_info)
-        assert 0.0 <= result <= 1.0  # Should return a valid score
+        # Size reports one score per hardware target
+        assert isinstance(result, dict) == returns_dict
+        scores = result.values() if returns_dict else [result]
+        assert all(0.0 <= score <= 1.0 for score in scores)
 
 
 class TestMetricsCalculator:
     """Test metrics calculator integration"""
     
-    def test_metrics_calculator_initialization(self):
+    def test_metrics_calculator_initialization(self, metrics_calculator):
         """Test metrics calculator initialization"""
-        calculator = MetricsCalculator()
-        assert calculator is not None
-        assert hasattr(calculator, 'license_metric')
-        assert hasattr(calculator, 'size_metric')
-        assert hasattr(calculator, 'rampup_metric')
-        assert hasattr(calculator, 'busfactor_metric')
-        assert hasattr(calculator, 'performance_metric')
-        assert hasattr(calculator, 'dataset_code_metric')
-        assert hasattr(calculator, 'dataset_quality_metric')
-        assert hasattr(calculator, 'code_quality_metric')
-    
-    def test_calculate_all_metrics_mock(self):
+        assert metrics_calculator is not None
+        assert hasattr(metrics_calculator, 'license_metric')
+        assert hasattr(metrics_calculator, 'size_metric')
+        assert hasattr(metrics_calculator, 'rampup_metric')
+        assert hasattr(metrics_calculator, 'busfactor_metric')
+        assert hasattr(metrics_calculator, 'performance_metric')
+        assert hasattr(metrics_calculator, 'dataset_code_metric')
+        assert hasattr(metrics_calculator, 'dataset_quality_metric')
+        assert hasattr(metrics_calculator, 'code_quality_metric')
+    
+    def test_calculate_all_metrics_mock(self, mocked_calculator, model_info_factory):
         """Test calculate all metrics with mocked results"""
-        calculator = MetricsCalculator()
         
-        model_info = ModelInfo(
-            name="test/model",
-            url="https://huggingface.co/test/model",
+        model_info = model_info_factory(
             api_data={'license': 'apache-2.0'},
-            model_index=None,
-            tags=None,
             likes=100,
             downloads=1000,
             last_modified="2024-01-01T00:00:00Z"
         )
         
-        # Mock all metric calculations
-        with patch.object(calculator.license_metric, 'calculate', return_value=0.9), \
-             patch.object(calculator.size_metric, 'calculate', return_value={'raspberry_pi': 0.5, 'jetson_nano': 0.8, 'desktop_pc': 1.0, 'aws_server': 1.0}), \
-             patch.object(calculator.rampup_metric, 'calculate', return_value=0.7), \
-             patch.object(calculator.busfactor_metric, 'calculate', return_value=0.6), \
-             patch.object(calculator.performance_metric, 'calculate', return_value=0.5), \
-             patch.object(calculator.dataset_code_metric, 'calculate', return_value=0.4), \
-             patch.object(calculator.dataset_quality_metric, 'calculate', return_value=0.3), \
-             patch.object(calculator.code_quality_metric, 'calculate', return_value=0.8):
-            
-            result = calculator.calculate_all_metrics(model_info)
-            
-            assert isinstance(result, dict)
-            assert 'name' in result
-            assert 'category' in result
-            assert 'net_score' in result
-            assert 'net_score_latency' in result
-            assert result['name'] == "test/model"
-            assert result['category'] == "MODEL"
-            assert 0.0 <= result['net_score'] <= 1.0
-    
-    def test_calculate_net_score(self):
+        # Every metric's calculate is mocked by the fixture
+        result = mocked_calculator.calculate_all_metrics(model_info)
+        
+        assert isinstance(result, dict)
+        assert 'name' in result
+        assert 'category' in result
+        assert 'net_score' in result
+        assert 'net_score_latency' in result
+        assert result['name'] == "test/model"
+        assert result['category'] == "MODEL"
+        assert 0.0 <= result['net_score'] <= 1.0
+    
+    def test_calculate_net_score(self, metrics_calculator, mock_size_scores):
         """Test net score calculation"""
-        calculator = MetricsCalculator()
         
         metrics = {
             'license': 0.9,
             'ramp_up_time': 0.7,
             'bus_factor': 0.6,
             'performance_claims': 0.5,
-            'size_score': {'raspberry_pi': 0.5, 'jetson_nano': 0.8, 'desktop_pc': 1.0, 'aws_server': 1.0},
+            'size_score': mock_size_scores,
             'dataset_and_code_score': 0.4,
             'dataset_quality': 0.3,
             'code_quality': 0.8
         }
         
-        net_score = calculator._calculate_net_score(metrics)
+        net_score = metrics_calculator._calculate_net_score(metrics)
         assert 0.0 <= net_score <= 1.0
     
-    def test_calculate_metric_with_timing(self):
+    def test_calculate_metric_with_timing(self, metrics_calculator, model_info_factory, monkeypatch):
         """Test metric calculation with timing"""
-        calculator = MetricsCalculator()
+        
+        # The calculator's clock only moves while the metric runs
+        clock = SimpleNamespace(now=100.0)
+        monkeypatch.setattr('src.metrics.calculator.time', SimpleNamespace(time=lambda: clock.now))
         
         def mock_calculate(model_info):
+            clock.now += 0.25
             return 0.5
         
-        model_info = ModelInfo(
-            name="test/model",
-            url="https://huggingface.co/test/model",
-            api_data={},
-            model_index=None,
-            tags=None,
-            likes=0,
-            downloads=0,
-            last_modified=None
-        )
+        model_info = model_info_factory()
         
-        result = calculator._calculate_metric_with_timing(mock_calculate, model_info)
+        result = metrics_calculator._calculate_metric_with_timing(mock_calculate, model_info)
         assert hasattr(result, 'value')
         assert hasattr(result, 'latency_ms')
         assert result.value == 0.5
-        assert result.latency_ms >= 0
+        assert result.latency_ms == 250
+
 
+@pytest.fixture(scope="module")
+def gemma_metrics(integration_http, metrics_calculator, model_info_factory):
+    """calculate_all_metrics for a real model, fetched once for all the checks on it"""
+    model_info = model_info_factory(
+        name="google/gemma-3-270m",
+        api_data={'license': 'apache-2.0'},
+        tags=['text-generation'],
+        likes=500,
+        downloads=10000,
+        last_modified="2024-01-01T00:00:00Z"
+    )
+    
+    # This will make actual API calls
+    with integration_http():
+        return metrics_calculator.calculate_all_metrics(model_info)
 
+
+# These reach huggingface.co, so under xdist keep them on one worker rather
+# than hitting the API from every core at once
+@pytest.mark.xdist_group("hf_http")
 class TestIntegrationComprehensive:
     """Comprehensive integration tests"""
     
-    def test_full_metrics_pipeline(self):
-        """Test full metrics calculation pipeline"""
-        calculator = MetricsCalculator()
-        
-        model_info = ModelInfo(
-            name="google/gemma-3-270m",
-            url="https://huggingface.co/google/gemma-3-270m",
-            api_data={'license': 'apache-2.0'},
-            model_index=None,
-            tags=['text-generation'],
-            likes=500,
-            downloads=10000,
-            last_modified="2024-01-01T00:00:00Z"
-        )
-        
-        # This will make actual API calls, so we expect it to work
-        result = calculator.calculate_all_metrics(model_info)
-        
-        assert isinstance(result, dict)
-        assert 'name' in result
-        assert 'net_score' in result
-        assert 'ramp_up_time' in result
-        assert 'bus_factor' in result
-        assert 'performance_claims' in result
-        assert 'license' in result
-        assert 'size_score' in result
-        assert 'dataset_and_code_score' in result
-        assert 'dataset_quality' in result
-        assert 'code_quality' in result
-        
-        # Check that all values are in valid ranges
-        for key, value in result.items():
-            if key.endswith('_latency'):
-                assert isinstance(value, int)
-                assert value >= 0
-            elif key == 'size_score':
-                assert isinstance(value, dict)
-                for hw, score in value.items():
-                    assert 0.0 <= score <= 1.0
-            elif key in ['name', 'category']:
+    @pytest.mark.integration
+    def test_full_metrics_pipeline_fields(self, gemma_metrics):
+        """Test the full pipeline reports every metric"""
+        assert isinstance(gemma_metrics, dict)
+        for field in ['name', 'net_score', 'ramp_up_time', 'bus_factor', 'performance_claims',
+                      'license', 'size_score', 'dataset_and_code_score', 'dataset_quality', 'code_quality']:
+            assert field in gemma_metrics
+    
+    @pytest.mark.integration
+    def test_full_metrics_pipeline_latencies(self, gemma_metrics):
+        """Test every latency is a non-negative integer"""
+        for key in LATENCY_KEYS:
+            assert isinstance(gemma_metrics[key], int)
+            assert gemma_metrics[key] >= 0
+    
+    @pytest.mark.integration
+    def test_full_metrics_pipeline_size_score(self, gemma_metrics):
+        """Test size_score maps each hardware target to a valid score"""
+        assert isinstance(gemma_metrics['size_score'], dict)
+        for hw, score in gemma_metrics['size_score'].items():
+            assert 0.0 <= score <= 1.0
+    
+    @pytest.mark.integration
+    def test_full_metrics_pipeline_scores(self, gemma_metrics):
+        """Test the name fields are strings and every score is in range"""
+        for key, value in gemma_metrics.items():
+            if key in LATENCY_KEYS or key == 'size_score':
+                continue
+            if key in STRING_KEYS:
                 assert isinstance(value, str)
             else:
                 assert 0.0 <= value <= 1.0
     
-    def test_metrics_calculation_with_exceptions(self):
+    def test_metrics_calculation_with_exceptions(self, hf_api, metrics_calculator, model_info_factory):
         """Test metrics calculation when some metrics fail"""
-        calculator = MetricsCalculator()
         
         # Create a model info that might cause some metrics to fail
-        model_info = ModelInfo(
-            name="invalid/model",
-            url="https://huggingface.co/invalid/model",
-            api_data={},
-            model_index=None,
-            tags=None,
-            likes=None,
-            downloads=None,
-            last_modified=None
-        )
+        model_info = model_info_factory(name="invalid/model", likes=None, downloads=None)
         
-        result = calculator.calculate_all_metrics(model_info)
+        result = metrics_calculator.calculate_all_metrics(model_info)
         
         # Should still return a valid result with default values
         assert isinstance(result, dict)
@@ -3,9 +3,10 @@
 Fixed comprehensive tests for URL parser to improve coverage
 """
 
+import asyncio
 import pytest
 from unittest.mock import Mock, patch
-from src.url_parser import URLParser
+from src.url_parser import URLParser, URLType
 
 
 class TestURLParserFixed:
@@ -68,6 +69,15 @@ class TestURLParserFixed:
             # The actual implementation treats GitHub URLs as MODEL, not CODE
             assert url_type in ["MODEL", "CODE", "UNKNOWN"]
     
+    def test_identify_url_type_returns_enum(self):
+        """Test URL types are URLType members that still compare as strings"""
+        parser = URLParser()
+        
+        url_type = parser.identify_url_type("https://huggingface.co/datasets/squad")
+        assert url_type is URLType.DATASET
+        assert url_type == "DATASET"
+        assert parser.identify_url_type("https://github.com/huggingface/transformers") is URLType.CODE
+    
     def test_identify_invalid_urls(self):
         """Test identifying invalid URLs"""
         parser = URLParser()
@@ -248,3 +258,29 @@ class TestURLParserFixed:
             # Default values should be used for missing fields
             assert model_info.downloads == 0
             assert model_info.likes == 0
+    
+    def test_api_url_matches_parsed_source(self):
+        """Test api_url names the endpoint each kind of URL is parsed from"""
+        parser = URLParser()
+        
+        assert parser.api_url("https://huggingface.co/google/gemma-3-270m/tree/main") == \
+            "https://huggingface.co/api/models/google/gemma-3-270m?blobs=true"
+        assert parser.api_url("https://huggingface.co/datasets/squad") == "https://huggingface.co/api/datasets/squad"
+        assert parser.api_url("https://github.com/owner/repo") == "https://api.github.com/repos/owner/repo"
+        assert parser.api_url("https://github.com/") is None
+    
+    def test_parse_url_async_matches_sync(self):
+        """Test the async variant returns the same result as parse_url"""
+        parser = URLParser()
+        
+        with patch('src.url_parser.requests.Session.get') as mock_get:
+            mock_response = Mock()
+            mock_response.status_code = 200
+            mock_response.json.return_value = {'id': 'test/model'}
+            mock_get.return_value = mock_response
+            
+            url = "https://huggingface.co/test/model"
+            result = asyncio.run(parser.parse_url_async(url))
+            
+            assert result == parser.parse_url(url)
+            assert result == {'name': 'test/model', 'type': 'model', 'url': url}
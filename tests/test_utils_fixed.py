@@ -6,10 +6,18 @@ Fixed comprehensive tests for utility modules to improve coverage
 import pytest
 import os
 import tempfile
+import threading
+import time
+import requests
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import Mock, patch, mock_open
 from src.utils.config import Config
 from src.utils.logger import setup_logger
 from src.utils.file_utils import FileUtils
+from src.utils.readme_cache import ReadmeCache
+from src.utils.http_cache import ApiCache
+from src.utils.concurrent_http import fetch_many
+from src.utils.term_matcher import TermMatcher
 
 
 class TestConfig:
@@ -237,3 +245,357 @@ class TestFileUtils:
         finally:
             if os.path.exists(temp_path):
                 os.unlink(temp_path)
+
+
+class TestReadmeCache:
+    """Test shared README cache"""
+    
+    def test_readme_fetched_once(self):
+        """Test repeated lookups reuse the first download"""
+        cache = ReadmeCache()
+        
+        with patch('src.utils.readme_cache.requests.Session.get') as mock_get:
+            mock_response = Mock()
+            mock_response.status_code = 200
+            mock_response.text = "# Model card"
+            mock_get.return_value = mock_response
+            
+            assert cache.get_readme('test/model') == "# Model card"
+            assert cache.get_readme('test/model') == "# Model card"
+            assert mock_get.call_count == 1
+    
+    def test_readme_lower_computed_once(self):
+        """Test the lowercased README is shared between callers"""
+        cache = ReadmeCache()
+        
+        with patch('src.utils.readme_cache.requests.Session.get') as mock_get:
+            mock_response = Mock()
+            mock_response.status_code = 200
+            mock_response.text = "# Model Card"
+            mock_get.return_value = mock_response
+            
+            lowered = cache.get_readme_lower('test/model')
+            assert lowered == "# model card"
+            assert cache.get_readme_lower('test/model') is lowered
+    
+    def test_missing_readme_returns_none(self):
+        """Test a non-200 response is cached as None"""
+        cache = ReadmeCache()
+        
+        with patch('src.utils.readme_cache.requests.Session.get') as mock_get:
+            mock_response = Mock()
+            mock_response.status_code = 404
+            mock_get.return_value = mock_response
+            
+            assert cache.get_readme('test/missing') is None
+            assert cache.get_readme('test/missing') is None
+            assert mock_get.call_count == 1
+    
+    def test_tree_fetched_once(self):
+        """Test the file listing is parsed once and shared"""
+        cache = ReadmeCache()
+        
+        with patch('src.utils.readme_cache.requests.Session.get') as mock_get:
+            mock_response = Mock()
+            mock_response.status_code = 200
+            mock_response.json.return_value = [{'path': 'model.py', 'size': 10}]
+            mock_get.return_value = mock_response
+            
+            assert cache.get_tree('test/model') == [{'path': 'model.py', 'size': 10}]
+            assert cache.get_tree('test/model') == [{'path': 'model.py', 'size': 10}]
+            assert mock_get.call_count == 1
+            assert mock_response.json.call_count == 1
+    
+    def test_tree_analysis_computed_once(self):
+        """Test a tree analyzer runs once per downloaded listing"""
+        cache = ReadmeCache()
+        analyzer = Mock(return_value=3)
+        
+        with patch('src.utils.readme_cache.requests.Session.get') as mock_get:
+            mock_response = Mock()
+            mock_response.status_code = 200
+            mock_response.json.return_value = [{'path': 'a.py'}]
+            mock_get.return_value = mock_response
+            
+            assert cache.analyze_tree('test/model', analyzer) == 3
+            assert cache.analyze_tree('test/model', analyzer) == 3
+            assert analyzer.call_count == 1
+    
+    def test_least_recently_used_evicted(self):
+        """Test the cache holds at most maxsize entries, dropping derived values too"""
+        cache = ReadmeCache(maxsize=2)
+        
+        with patch('src.utils.readme_cache.requests.Session.get') as mock_get:
+            mock_response = Mock()
+            mock_response.status_code = 200
+            mock_response.text = "# Model Card"
+            mock_get.return_value = mock_response
+            
+            cache.get_readme_lower('test/a')
+            cache.get_readme('test/b')
+            cache.get_readme('test/a')  # a is now the most recently used
+            cache.get_readme('test/c')
+            
+            assert set(cache._entries) == {('readme', 'test/a'), ('readme', 'test/c')}
+            assert ('readme', 'test/b') not in cache._key_locks
+            
+            cache.get_readme('test/d')
+            assert ('readme', 'test/a') not in cache._derived
+            assert ('readme', 'test/a') not in cache._key_locks
+    
+    def test_expired_entries_dropped(self):
+        """Test expired entries are removed when new ones arrive, not just skipped"""
+        cache = ReadmeCache(ttl=60)
+        clock = [1000.0]
+        
+        with patch('src.utils.readme_cache.requests.Session.get') as mock_get, \
+             patch('src.utils.readme_cache.time.monotonic', lambda: clock[0]):
+            mock_response = Mock()
+            mock_response.status_code = 200
+            mock_response.text = "# Model Card"
+            mock_get.return_value = mock_response
+            
+            cache.get_readme_lower('test/a')
+            assert ('readme', 'test/a') in cache._derived
+            
+            clock[0] += 61
+            cache.get_readme('test/b')
+            
+            assert ('readme', 'test/a') not in cache._entries
+            assert ('readme', 'test/a') not in cache._derived
+            assert ('readme', 'test/a') not in cache._key_locks
+    
+    def test_disk_cache_revalidates(self, tmp_path):
+        """Test a second run reuses the stored body on 304"""
+        with patch('src.utils.readme_cache.requests.Session.get') as mock_get:
+            first = Mock()
+            first.status_code = 200
+            first.text = "# Model card"
+            first.headers = {'ETag': '"abc"'}
+            mock_get.return_value = first
+            assert ReadmeCache(cache_dir=str(tmp_path)).get_readme('test/model') == "# Model card"
+            
+            not_modified = Mock()
+            not_modified.status_code = 304
+            mock_get.return_value = not_modified
+            assert ReadmeCache(cache_dir=str(tmp_path)).get_readme('test/model') == "# Model card"
+            assert mock_get.call_args.kwargs['headers'] == {'If-None-Match': '"abc"'}
+
+
+class TestApiCache:
+    """Test shared JSON API response cache"""
+    
+    def test_response_reused_within_ttl(self):
+        """Test a second lookup is served from the cache"""
+        cache = ApiCache()
+        
+        with patch('src.utils.http_cache.requests.Session.get') as mock_get:
+            mock_response = Mock()
+            mock_response.status_code = 200
+            mock_response.json.return_value = {'downloads': 5}
+            mock_get.return_value = mock_response
+            
+            assert cache.get('https://huggingface.co/api/models/a') == (200, {'downloads': 5})
+            assert cache.get('https://huggingface.co/api/models/a') == (200, {'downloads': 5})
+            assert mock_get.call_count == 1
+    
+    def test_stale_entry_served_when_offline(self):
+        """Test an expired entry is returned if the refresh cannot connect"""
+        cache = ApiCache(ttl=0)
+        
+        with patch('src.utils.http_cache.requests.Session.get') as mock_get:
+            mock_response = Mock()
+            mock_response.status_code = 200
+            mock_response.json.return_value = {'likes': 1}
+            mock_get.return_value = mock_response
+            cache.get('https://huggingface.co/api/models/b')
+            
+            mock_get.side_effect = requests.ConnectionError("offline")
+            assert cache.get('https://huggingface.co/api/models/b') == (200, {'likes': 1})
+    
+    def test_expired_entry_revalidated_with_etag(self):
+        """Test a 304 after expiry keeps the stored body"""
+        cache = ApiCache(ttl=0)
+        url = 'https://api.github.com/repos/a/b'
+        
+        with patch('src.utils.http_cache.requests.Session.get') as mock_get:
+            ok_response = Mock()
+            ok_response.status_code = 200
+            ok_response.headers = {'ETag': '"v1"'}
+            ok_response.json.return_value = {'stargazers_count': 3}
+            not_modified = Mock()
+            not_modified.status_code = 304
+            mock_get.side_effect = [ok_response, not_modified]
+            
+            cache.get(url)
+            assert cache.get(url) == (200, {'stargazers_count': 3})
+            assert mock_get.call_args.kwargs['headers'] == {'If-None-Match': '"v1"'}
+            not_modified.json.assert_not_called()
+    
+    def test_rate_limited_response_not_cached(self):
+        """Test a 403 is fetched again rather than pinned for the ttl"""
+        cache = ApiCache()
+        url = 'https://api.github.com/repos/a/c'
+        
+        with patch('src.utils.http_cache.requests.Session.get') as mock_get:
+            rate_limited = Mock()
+            rate_limited.status_code = 403
+            rate_limited.headers = {}
+            ok_response = Mock()
+            ok_response.status_code = 200
+            ok_response.headers = {}
+            ok_response.json.return_value = {'stargazers_count': 5}
+            mock_get.side_effect = [rate_limited, ok_response]
+            
+            assert cache.get(url) == (403, None)
+            assert cache.get(url) == (200, {'stargazers_count': 5})
+            assert mock_get.call_count == 2
+    
+    def test_error_on_refresh_keeps_stale_entry(self):
+        """Test a 403 on refresh serves the stored body instead of replacing it"""
+        cache = ApiCache(ttl=0)
+        url = 'https://api.github.com/repos/a/d'
+        
+        with patch('src.utils.http_cache.requests.Session.get') as mock_get:
+            ok_response = Mock()
+            ok_response.status_code = 200
+            ok_response.headers = {}
+            ok_response.json.return_value = {'stargazers_count': 8}
+            rate_limited = Mock()
+            rate_limited.status_code = 403
+            rate_limited.headers = {}
+            mock_get.side_effect = [ok_response, rate_limited]
+            cache.get(url)
+            
+            assert cache.get(url) == (200, {'stargazers_count': 8})
+            assert mock_get.call_count == 2
+            assert cache.get(url, ttl=60) == (200, {'stargazers_count': 8})
+    
+    def test_concurrent_lookups_share_one_request(self):
+        """Test simultaneous misses for one URL issue a single GET"""
+        cache = ApiCache()
+        url = 'https://huggingface.co/api/models/d'
+        release = threading.Event()
+        
+        def slow_get(self, url, **kwargs):
+            release.wait(5)
+            response = Mock()
+            response.status_code = 200
+            response.headers = {}
+            response.json.return_value = {'likes': 4}
+            return response
+        
+        with patch('src.utils.http_cache.requests.Session.get', autospec=True, side_effect=slow_get) as mock_get:
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                futures = [executor.submit(cache.get, url) for _ in range(4)]
+                time.sleep(0.05)
+                release.set()
+                results = [future.result() for future in futures]
+            
+            assert results == [(200, {'likes': 4})] * 4
+            assert mock_get.call_count == 1
+    
+    def test_disk_cache_survives_restart(self, tmp_path):
+        """Test a new cache instance revalidates the body stored on disk"""
+        url = 'https://huggingface.co/api/models/e'
+        
+        with patch('src.utils.http_cache.requests.Session.get') as mock_get:
+            first = Mock()
+            first.status_code = 200
+            first.text = '{"likes": 7}'
+            first.headers = {'ETag': '"e1"'}
+            first.json.return_value = {'likes': 7}
+            mock_get.return_value = first
+            ApiCache(cache_dir=str(tmp_path)).get(url)
+            
+            not_modified = Mock()
+            not_modified.status_code = 304
+            mock_get.return_value = not_modified
+            assert ApiCache(cache_dir=str(tmp_path)).get(url) == (200, {'likes': 7})
+            assert mock_get.call_args.kwargs['headers'] == {'If-None-Match': '"e1"'}
+    
+    def test_invalidate_drops_memory_and_disk_entries(self, tmp_path):
+        """Test an invalidated URL is downloaded again without validators"""
+        cache = ApiCache(cache_dir=str(tmp_path))
+        url = 'https://huggingface.co/api/models/f'
+        
+        with patch('src.utils.http_cache.requests.Session.get') as mock_get:
+            mock_response = Mock()
+            mock_response.status_code = 200
+            mock_response.text = '{"likes": 1}'
+            mock_response.headers = {'ETag': '"f1"'}
+            mock_response.json.return_value = {'likes': 1}
+            mock_get.return_value = mock_response
+            cache.get(url)
+            
+            cache.invalidate(url)
+            mock_response.json.return_value = {'likes': 2}
+            assert cache.get(url) == (200, {'likes': 2})
+            assert mock_get.call_count == 2
+            assert mock_get.call_args.kwargs['headers'] == {}
+    
+    def test_stale_entry_refreshed_in_background(self):
+        """Test an expired entry within stale_ttl is returned while it refreshes"""
+        cache = ApiCache(ttl=0, stale_ttl=60)
+        url = 'https://huggingface.co/api/models/c'
+        
+        with patch('src.utils.http_cache.requests.Session.get') as mock_get:
+            mock_response = Mock()
+            mock_response.status_code = 200
+            mock_response.json.return_value = {'likes': 1}
+            mock_get.return_value = mock_response
+            cache.get(url)
+            
+            mock_response.json.return_value = {'likes': 2}
+            assert cache.get(url) == (200, {'likes': 1})
+            
+            # The refreshed body lands once the background fetch finishes
+            deadline = time.monotonic() + 5
+            while cache.get(url, ttl=60) != (200, {'likes': 2}) and time.monotonic() < deadline:
+                time.sleep(0.01)
+            assert cache.get(url, ttl=60) == (200, {'likes': 2})
+
+
+class TestFetchMany:
+    """Test concurrent fetching of independent URLs"""
+    
+    def test_fetch_many_maps_each_url(self):
+        """Test every URL gets its body, and failures map to None"""
+        def fake_get(self, url, **kwargs):
+            if url.endswith('down'):
+                raise requests.ConnectionError("offline")
+            response = Mock()
+            response.status_code = 200 if url.endswith('ok') else 404
+            response.text = f"body of {url}"
+            return response
+        
+        with patch('src.utils.concurrent_http.requests.Session.get', fake_get):
+            result = fetch_many(['https://x/ok', 'https://x/missing', 'https://x/down'], as_json=False)
+        
+        assert result == {
+            'https://x/ok': 'body of https://x/ok',
+            'https://x/missing': None,
+            'https://x/down': None
+        }
+    
+    def test_fetch_many_empty(self):
+        """Test an empty batch does no work"""
+        assert fetch_many([]) == {}
+
+
+class TestTermMatcher:
+    """Test vocabulary matching"""
+    
+    def test_matches_substring_semantics(self):
+        """Test find agrees with per-term substring checks"""
+        terms = ['eval', 'evaluation', 'arc', 'search', 'test', 'pytest', 'bleu']
+        matcher = TermMatcher(terms)
+        text = "we run pytest and report evaluation on research tasks"
+        assert matcher.find(text) == {t for t in terms if t in text}
+        assert matcher.count(text) == 6
+    
+    def test_any(self):
+        """Test any reports whether a term occurs"""
+        matcher = TermMatcher(['spacy', 'nltk'])
+        assert matcher.any("tokenized with nltk")
+        assert not matcher.any("no tools here")